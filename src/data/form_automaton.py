@@ -0,0 +1,157 @@
+from array import array
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+
+class _BuildState:
+    """Mutable state used only while building the automaton"""
+
+    __slots__ = ('edges', 'final')
+
+    def __init__(self):
+        self.edges = {}
+        self.final = False
+
+    def signature(self):
+        # Children are already minimized when this is asked, so their
+        # identity stands for their whole right language
+        return self.final, tuple((char, id(child)) for char, child in sorted(self.edges.items()))
+
+
+class FormAutomaton:
+    """
+    Minimized acyclic automaton (DAWG) over a set of word forms
+
+    Shared prefixes and shared endings are stored once, which for inflected
+    forms (книга, книги, книгу ... новый, новая, новое ...) keeps the
+    automaton far smaller than a set of the strings. Membership and prefix
+    walks take time proportional to the query, and suggest() finds the forms
+    within a small edit distance for "did you mean" hints.
+
+    After construction the states are packed into flat arrays: the edges of
+    state s are labels[offsets[s]:offsets[s + 1]] (sorted) leading to the
+    states at the same positions in targets.
+    """
+
+    def __init__(self, words: Iterable[str]):
+        root = self._build(sorted(set(words)))
+        self._pack(root)
+
+    def _build(self, words: List[str]) -> _BuildState:
+        """Incremental construction from sorted input (Daciuk et al.)"""
+        root = _BuildState()
+        register = {}
+        unchecked = []      # (parent, char, child) along the last word's path
+        previous = ''
+
+        def minimize(down_to: int):
+            while len(unchecked) > down_to:
+                parent, char, child = unchecked.pop()
+                signature = child.signature()
+                if signature in register:
+                    parent.edges[char] = register[signature]
+                else:
+                    register[signature] = child
+
+        for word in words:
+            common = 0
+            while common < min(len(word), len(previous)) and word[common] == previous[common]:
+                common += 1
+            minimize(common)
+
+            node = unchecked[-1][2] if unchecked else root
+            for char in word[common:]:
+                child = _BuildState()
+                node.edges[char] = child
+                unchecked.append((node, char, child))
+                node = child
+            node.final = True
+            previous = word
+
+        minimize(0)
+        self.word_count = len(words)
+        return root
+
+    def _pack(self, root: _BuildState):
+        numbers = {id(root): 0}
+        order = [root]
+        for state in order:
+            for _, child in sorted(state.edges.items()):
+                if id(child) not in numbers:
+                    numbers[id(child)] = len(order)
+                    order.append(child)
+
+        labels = []
+        self._targets = array('I')
+        self._offsets = array('I', [0])
+        self._final = bytearray(len(order))
+        for number, state in enumerate(order):
+            for char, child in sorted(state.edges.items()):
+                labels.append(char)
+                self._targets.append(numbers[id(child)])
+            self._offsets.append(len(labels))
+            self._final[number] = state.final
+        self._labels = ''.join(labels)
+
+    @property
+    def state_count(self) -> int:
+        return len(self._final)
+
+    def _step(self, state: int, char: str) -> Optional[int]:
+        position = self._labels.find(char, self._offsets[state], self._offsets[state + 1])
+        return None if position < 0 else self._targets[position]
+
+    def _walk(self, text: str) -> Optional[int]:
+        state = 0
+        for char in text:
+            state = self._step(state, char)
+            if state is None:
+                return None
+        return state
+
+    def _edges(self, state: int) -> Iterator[Tuple[str, int]]:
+        for position in range(self._offsets[state], self._offsets[state + 1]):
+            yield self._labels[position], self._targets[position]
+
+    def __contains__(self, word: str) -> bool:
+        state = self._walk(word)
+        return state is not None and bool(self._final[state])
+
+    def __len__(self) -> int:
+        return self.word_count
+
+    def complete(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """Words starting with prefix, in sorted order, at most limit of them"""
+        state = self._walk(prefix)
+        if state is None:
+            return []
+
+        found = []
+        stack = [(state, prefix)]
+        while stack and (limit is None or len(found) < limit):
+            state, text = stack.pop()
+            if self._final[state]:
+                found.append(text)
+            # Pushed in reverse so the smallest label is expanded first
+            stack.extend((target, text + char) for char, target in reversed(list(self._edges(state))))
+        return found
+
+    def suggest(self, word: str, max_distance: int = 1, limit: int = 5) -> List[str]:
+        """Words within max_distance edits of word, closest first"""
+        found = []
+        first_row = list(range(len(word) + 1))
+        stack = [(0, '', first_row)]
+        while stack:
+            state, text, row = stack.pop()
+            if self._final[state] and row[-1] <= max_distance:
+                found.append((row[-1], text))
+            for char, target in self._edges(state):
+                # One more row of the Levenshtein table for text + char
+                next_row = [row[0] + 1]
+                for column in range(1, len(word) + 1):
+                    cost = 0 if word[column - 1] == char else 1
+                    next_row.append(min(next_row[column - 1] + 1, row[column] + 1, row[column - 1] + cost))
+                if min(next_row) <= max_distance:
+                    stack.append((target, text + char, next_row))
+
+        found.sort()
+        return [text for _, text in found[:limit]]
@@ -0,0 +1,194 @@
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+from data.form_automaton import FormAutomaton
+from data.noun_database import NounDatabase
+from data.adjective_database import AdjectiveDatabase
+from data.pronoun_database import PronounDatabase
+from data.verb_database import VerbDatabase
+
+# Stress marks used in the pronoun tables (combining acute and grave accents)
+STRESS_MARKS = {ord('\u0301'): None, ord('\u0300'): None}
+
+PLURAL_PRONOUNS = {'мы', 'вы', 'они'}
+PRONOUN_GENDERS = {'он': 'masculine', 'она': 'feminine', 'оно': 'neuter'}
+
+
+def normalize_form(form: str) -> str:
+    """Lowercase, without stress marks and with ё folded to е, as typed answers are compared"""
+    return form.strip().lower().translate(STRESS_MARKS).replace('ё', 'е')
+
+
+def form_variants(form: str) -> List[str]:
+    """
+    The spellings a table entry stands for
+
+    Pronoun tables write the forms taken after prepositions with a
+    parenthesized н: '(н)его' is both его and него.
+    """
+    full = form.replace('(', '').replace(')', '')
+    if form.startswith('(') and ')' in form:
+        return [form[form.index(')') + 1:], full]
+    return [full]
+
+
+class FormAnalysis(NamedTuple):
+    """One reading of an inflected form"""
+    lemma: str
+    pos: str                        # 'noun', 'adjective', 'pronoun' or 'verb'
+    case: Optional[str] = None
+    number: Optional[str] = None    # 'singular' or 'plural'
+    gender: Optional[str] = None
+    person: Optional[str] = None    # verb subject pronoun (я ... они)
+    tense: Optional[str] = None     # 'infinitive', 'present', 'future' or 'past'
+
+    def describe(self) -> str:
+        """Short grammatical label such as 'genitive plural' or 'past feminine'"""
+        if self.pos == 'verb':
+            parts = [self.tense, self.person if self.tense != 'past' else self.gender or self.number]
+        else:
+            parts = [self.case, self.number]
+            if self.gender and self.number != 'plural' and self.pos == 'adjective':
+                parts.append(self.gender)
+        return ' '.join(part for part in parts if part)
+
+
+class FormIndex:
+    """
+    Inverted index from every inflected form in the grammar databases to its
+    analyses
+
+    Forms are keyed by normalize_form(), so lookups ignore case, stress marks
+    and ё/е. The index is built on first lookup. Autocomplete and "did you
+    mean" go through a FormAutomaton over the same keys plus the lemmas that
+    vocabulary() yields, if given; it is only called when the automaton is
+    first needed, so plain lookups never read the vocabulary. Both answer
+    with the words as the tables and the vocabulary spell them.
+    """
+
+    def __init__(self, noun_db: Optional[NounDatabase] = None,
+                 adjective_db: Optional[AdjectiveDatabase] = None,
+                 pronoun_db: Optional[PronounDatabase] = None,
+                 verb_db: Optional[VerbDatabase] = None,
+                 vocabulary: Optional[Callable[[], Iterable[str]]] = None):
+        self.noun_db = noun_db or NounDatabase()
+        self.adjective_db = adjective_db or AdjectiveDatabase()
+        self.pronoun_db = pronoun_db or PronounDatabase()
+        self.verb_db = verb_db or VerbDatabase()
+        self.vocabulary = vocabulary
+        self._forms = None
+        self._spellings = None      # normalized form -> spellings in the tables
+        self._automaton = None
+
+    def _ensure_built(self) -> Dict[str, List[FormAnalysis]]:
+        if self._forms is None:
+            forms = {}
+            spellings = {}
+            for form, analysis in self._iter_forms():
+                for variant in form_variants(form):
+                    key = normalize_form(variant)
+                    readings = forms.setdefault(key, [])
+                    if analysis not in readings:
+                        readings.append(analysis)
+                    spelled = spellings.setdefault(key, [])
+                    if variant.strip() not in spelled:
+                        spelled.append(variant.strip())
+            self._forms = forms
+            self._spellings = spellings
+        return self._forms
+
+    def _iter_forms(self) -> Iterator:
+        """(form, analysis) for every form in the databases"""
+        for noun, entry in self.noun_db.get_all_nouns().items():
+            gender = entry.get('gender')
+            for key, form in entry.items():
+                if key in ('declension', 'gender', 'animacy'):
+                    continue
+                case, _, plural = key.partition('_')
+                number = 'plural' if plural else 'singular'
+                yield form, FormAnalysis(noun, 'noun', case, number, gender)
+
+        for adjective, genders in self.adjective_db.get_all_adjectives().items():
+            for gender, cases in genders.items():
+                number = 'plural' if gender == 'plural' else 'singular'
+                for case, form in cases.items():
+                    yield form, FormAnalysis(adjective, 'adjective', case, number,
+                                             None if gender == 'plural' else gender)
+
+        for pronoun, cases in self.pronoun_db.get_all_pronouns().items():
+            number = 'plural' if pronoun in PLURAL_PRONOUNS else 'singular'
+            for case, form in cases.items():
+                yield form, FormAnalysis(pronoun, 'pronoun', case, number, PRONOUN_GENDERS.get(pronoun))
+
+        for infinitive, verb in self.verb_db.get_all_verbs().items():
+            yield infinitive, FormAnalysis(infinitive, 'verb', tense='infinitive')
+            for tense in ('present', 'future'):
+                for person, form in verb.get(tense, {}).items():
+                    number = 'plural' if person in PLURAL_PRONOUNS else 'singular'
+                    yield form, FormAnalysis(infinitive, 'verb', number=number, person=person, tense=tense)
+            for gender, form in verb.get('past', {}).items():
+                number = 'plural' if gender == 'plural' else 'singular'
+                yield form, FormAnalysis(infinitive, 'verb', number=number,
+                                         gender=None if gender == 'plural' else gender, tense='past')
+
+    @property
+    def automaton(self) -> FormAutomaton:
+        """Automaton over every indexed form and vocabulary lemma (normalized), built on first use"""
+        if self._automaton is None:
+            words = set(self._ensure_built())
+            if self.vocabulary is not None:
+                for lemma in self.vocabulary():
+                    key = normalize_form(lemma)
+                    words.add(key)
+                    spelled = self._spellings.setdefault(key, [])
+                    if lemma.strip() not in spelled:
+                        spelled.append(lemma.strip())
+            self._automaton = FormAutomaton(words)
+        return self._automaton
+
+    def invalidate(self):
+        """Rebuild the index on next lookup, after the databases have changed"""
+        self._forms = None
+        self._spellings = None
+        self._automaton = None
+
+    def _spelled(self, keys: List[str], limit: Optional[int]) -> List[str]:
+        """The table spellings (with ё, capitals, stress marks) of normalized forms"""
+        self._ensure_built()
+        found = []
+        for key in keys:
+            for spelling in self._spellings.get(key, [key]):
+                if spelling not in found:
+                    found.append(spelling)
+        return found if limit is None else found[:limit]
+
+    def lookup(self, form: str) -> List[FormAnalysis]:
+        """Every analysis of a form, or an empty list for unknown forms"""
+        return list(self._ensure_built().get(normalize_form(form), []))
+
+    def lemmas(self, form: str) -> List[str]:
+        """Distinct lemmas a form belongs to"""
+        found = []
+        for analysis in self.lookup(form):
+            if analysis.lemma not in found:
+                found.append(analysis.lemma)
+        return found
+
+    def diagnose(self, answer: str, lemma: str) -> List[FormAnalysis]:
+        """
+        What a (wrong) answer actually is, among the forms of the expected
+        lemma; empty when the answer is not a form of that lemma at all
+        """
+        return [analysis for analysis in self.lookup(answer) if analysis.lemma == lemma]
+
+    def complete(self, prefix: str, limit: Optional[int] = 10) -> List[str]:
+        """Known forms and lemmas starting with prefix, in sorted order"""
+        return self._spelled(self.automaton.complete(normalize_form(prefix), limit), limit)
+
+    def suggest(self, answer: str, max_distance: int = 1, limit: int = 5) -> List[str]:
+        """Known forms and lemmas closest to a misspelled answer"""
+        return self._spelled(self.automaton.suggest(normalize_form(answer), max_distance, limit), limit)
+
+    def __contains__(self, form: str) -> bool:
+        return normalize_form(form) in self._ensure_built()
+
+    def __len__(self) -> int:
+        return len(self._ensure_built())
@@ -0,0 +1,38 @@
+"""
+On-disk grammar word lists
+
+The nouns, adjectives and verbs the drills use are kept as small JSON files
+under data/grammar (nouns split by declension class) rather than Python
+literals. Each file is read at most once per process, on first access; the
+loaders hand out fresh containers so callers can extend them.
+"""
+import json
+import os
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+GRAMMAR_DIR = os.path.join(os.path.dirname(__file__), 'grammar')
+
+NOUN_DECLENSIONS = ('first', 'second', 'third')
+
+
+@lru_cache(maxsize=None)
+def _read(name: str):
+    with open(os.path.join(GRAMMAR_DIR, name), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_noun_specs(declension: str) -> Dict[str, Tuple]:
+    """nominative -> (declension, gender, animacy, has plural forms) for one declension class"""
+    rows = _read(f'nouns_{declension}.json')
+    return {noun: (declension, gender, animacy, has_plural) for noun, (gender, animacy, has_plural) in rows.items()}
+
+
+def load_adjective_list() -> List[str]:
+    """Masculine nominatives of the drilled adjectives"""
+    return list(_read('adjectives.json'))
+
+
+def load_verb_specs() -> Dict[str, Tuple]:
+    """infinitive -> (translation, aspect, conjugation, irregular)"""
+    return {infinitive: tuple(spec) for infinitive, spec in _read('verbs.json').items()}
@@ -0,0 +1,143 @@
+import os
+from typing import Dict, List, Optional
+from data.load_report import LoadReport
+from data.vocabulary_entry import VocabEntry
+from data.vocabulary_extractor import VocabularyExtractor
+from data.russian_norwegian_extractor import RussianNorwegianExtractor
+from data.vocabulary_index import VocabularyIndex
+
+LANGUAGES = ('english', 'norwegian')
+
+
+class Lexicon:
+    """
+    Russian lemmas merged from the SMARTool (English) and russisk_norsk
+    (Norwegian) vocabularies
+
+    Each lemma appears once, with every distinct gloss in both languages and
+    one POS/level/aspect index shared by both practice directions. The merged
+    view is rebuilt only when one of the underlying CSV files changes.
+    """
+
+    def __init__(self, english_source: Optional[VocabularyExtractor] = None,
+                 norwegian_source: Optional[RussianNorwegianExtractor] = None,
+                 quiet: bool = False):
+        self.sources = {
+            'english': english_source or VocabularyExtractor(quiet=quiet),
+            'norwegian': norwegian_source or RussianNorwegianExtractor(quiet=quiet)
+        }
+        self._entries = {}      # russian -> merged VocabEntry
+        self._glosses = {}      # russian -> {language: [glosses in file order]}
+        self._pools = {}        # language -> entries with that gloss, in source order
+        self._ranks = {}        # language -> {russian: position in its pool}
+        self._index = None
+        self._source_words = None   # language -> the source word list last merged
+
+    def _ensure_loaded(self):
+        """Merge the sources again if either CSV changed since the last merge"""
+        loaded = {
+            language: source.loaded_words() if os.path.exists(source.csv_file) else None
+            for language, source in self.sources.items()
+        }
+        # The extractors hand out the same list until they reload, and the
+        # lists themselves are kept here, so identity means unchanged
+        if self._index is not None and all(
+                loaded[language] is self._source_words[language] for language in LANGUAGES):
+            return
+        source_words = {language: words or [] for language, words in loaded.items()}
+
+        entries = {}
+        glosses = {}
+        pools = {}
+        for language in LANGUAGES:
+            pool = []
+            pooled = set()
+            for word in source_words[language]:
+                gloss = getattr(word, language)
+                senses = glosses.setdefault(word.russian, {'english': [], 'norwegian': []})
+                if gloss not in senses[language]:
+                    senses[language].append(gloss)
+
+                entry = entries.get(word.russian)
+                if entry is None:
+                    entry = VocabEntry(word.russian, english=word.english, norwegian=word.norwegian,
+                                       pos=word.pos, level=word.level, aspect=word.aspect)
+                    entries[word.russian] = entry
+                else:
+                    self._merge_into(entry, word, language)
+
+                # Duplicate rows in a source only add glosses, not pool slots
+                if word.russian not in pooled:
+                    pooled.add(word.russian)
+                    pool.append(entry)
+            pools[language] = pool
+
+        self._entries = entries
+        self._glosses = glosses
+        self._pools = pools
+        self._ranks = {
+            language: {entry.russian: rank for rank, entry in enumerate(pool)}
+            for language, pool in pools.items()
+        }
+        self._index = VocabularyIndex(list(entries.values()))
+        self._source_words = loaded
+
+    def _merge_into(self, entry: VocabEntry, word: VocabEntry, language: str):
+        """Fill in what an existing entry is missing from another row of the same lemma"""
+        if getattr(entry, language) is None:
+            setattr(entry, language, getattr(word, language))
+        if (not entry.pos or entry.pos == 'N/A') and word.pos and word.pos != 'N/A':
+            entry.pos = word.pos
+        elif word.pos == 'V' and not entry.pos.startswith('V'):
+            # An infinitive gloss ('å ...') is a verb even when the first
+            # SMARTool row of the lemma was tagged as a participle
+            entry.pos = word.pos
+        if (not entry.level or entry.level == 'N/A') and word.level and word.level != 'N/A':
+            entry.level = word.level
+        if (entry.aspect is None or entry.aspect == 'unknown') and word.aspect not in (None, 'unknown'):
+            entry.aspect = word.aspect
+
+    def load(self) -> Dict[str, LoadReport]:
+        """
+        Load the sources if needed; the reports of the loads this call
+        actually did, by language (empty when both were already current)
+        """
+        previous = {language: source.last_report for language, source in self.sources.items()}
+        self._ensure_loaded()
+        return {
+            language: source.last_report for language, source in self.sources.items()
+            if source.last_report is not previous[language]
+        }
+
+    def get(self, russian: str) -> Optional[VocabEntry]:
+        """The merged entry for a Russian lemma"""
+        self._ensure_loaded()
+        return self._entries.get(russian)
+
+    def glosses(self, russian: str, language: str) -> List[str]:
+        """Every distinct gloss of a lemma in one language"""
+        self._ensure_loaded()
+        return list(self._glosses.get(russian, {}).get(language, []))
+
+    def words(self, language: str) -> List[VocabEntry]:
+        """All lemmas that have a gloss in the given language, in that source's order"""
+        self._ensure_loaded()
+        return list(self._pools.get(language, []))
+
+    def query(self, language: Optional[str] = None, pos: Optional[str] = None,
+              level: Optional[str] = None, aspect: Optional[str] = None) -> List[VocabEntry]:
+        """
+        Lemmas matching the POS prefix, level and aspect filters; with a
+        language, only lemmas glossed in it, in that source's order
+        """
+        self._ensure_loaded()
+        matches = self._index.query(pos=pos, level=level, aspect=aspect)
+        if language is None:
+            return matches
+
+        ranks = self._ranks.get(language, {})
+        return sorted((w for w in matches if w.russian in ranks), key=lambda w: ranks[w.russian])
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._entries)
@@ -0,0 +1,72 @@
+import os
+from typing import Dict, Optional
+
+
+class LoadReport:
+    """
+    What one vocabulary load did
+
+    cache is 'memory' (extractor already had the words), 'snapshot' (loaded
+    from the binary snapshot), 'append' (only rows appended to the CSV were
+    parsed) or 'miss' (full parse). Row counts and bytes cover the rows that
+    were actually parsed.
+    """
+
+    def __init__(self, source: str, cache: str = 'miss'):
+        self.source = source
+        self.cache = cache
+        self.rows_processed = 0
+        self.rows_kept = 0
+        self.rows_skipped = 0
+        self.bytes_parsed = 0
+        self.parse_seconds = 0.0
+        self.words = 0
+        self.error: Optional[str] = None
+
+    @property
+    def cache_hit(self) -> bool:
+        return self.cache in ('memory', 'snapshot')
+
+    @property
+    def parsed(self) -> bool:
+        return self.cache in ('miss', 'append') and self.error is None
+
+    def finish_rows(self, rows_kept: int):
+        """Record how many of the processed rows became words"""
+        self.rows_kept = rows_kept
+        self.rows_skipped = self.rows_processed - rows_kept
+
+    def to_dict(self) -> Dict:
+        return {
+            'source': self.source,
+            'cache': self.cache,
+            'rows_processed': self.rows_processed,
+            'rows_kept': self.rows_kept,
+            'rows_skipped': self.rows_skipped,
+            'bytes_parsed': self.bytes_parsed,
+            'parse_seconds': self.parse_seconds,
+            'words': self.words,
+            'error': self.error
+        }
+
+    def summary(self) -> str:
+        """Human-readable summary in the style of the old per-load printout"""
+        name = os.path.basename(self.source)
+        if self.error:
+            return f"❌ {name}: {self.error}"
+        if not self.parsed:
+            return f"📊 {name}: {self.words} words ({self.cache} cache hit)"
+
+        kind = 'appended rows' if self.cache == 'append' else 'full parse'
+        lines = [
+            f"📊 CSV Processing Summary ({name}, {kind}):",
+            f"   Total rows processed: {self.rows_processed}",
+            f"   Words extracted: {self.rows_kept}"
+        ]
+        if self.rows_skipped > 0:
+            lines.append(f"   Skipped rows (empty/deleted/duplicate): {self.rows_skipped}")
+        lines.append(f"   Parsed {self.bytes_parsed / 1024:.1f} KB in {self.parse_seconds:.2f}s")
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return f"LoadReport({self.to_dict()!r})"
@@ -0,0 +1,114 @@
+"""
+Vectorized word scoring for WordPracticeDatabase
+
+Column-wise versions of _calculate_mastery_level and the review priority,
+used when the whole vocabulary has to be scored at once. NumPy is optional:
+when it is missing, HAVE_NUMPY is False and the database keeps using its
+per-word methods.
+"""
+from typing import Dict, List
+
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:
+    np = None
+    HAVE_NUMPY = False
+
+# Below this many words the per-word Python path is just as fast
+BATCH_THRESHOLD = 2000
+
+
+def pack_word_stats(word_records: List[Dict]) -> Dict:
+    """
+    Pack per-word statistics into column arrays
+
+    last_practiced stays in epoch seconds, with NaN for words that have
+    no practice date.
+    """
+    count = len(word_records)
+    last_epochs = np.fromiter(
+        (np.nan if r.get('last_practiced') is None else r['last_practiced'] for r in word_records),
+        dtype=np.float64, count=count
+    )
+
+    return {
+        'total_attempts': np.fromiter((r.get('total_attempts', 0) for r in word_records), dtype=np.int64, count=count),
+        'correct': np.fromiter((r.get('correct', 0) for r in word_records), dtype=np.int64, count=count),
+        'streak': np.fromiter((r.get('streak', 0) for r in word_records), dtype=np.int64, count=count),
+        'mastery_level': np.fromiter((r.get('mastery_level', 0) for r in word_records), dtype=np.int64, count=count),
+        'last_practiced': last_epochs
+    }
+
+
+def batch_mastery_levels(columns: Dict, now_epoch: float):
+    """Mastery level (0-5) for every word, same rules as _calculate_mastery_level"""
+    total_attempts = columns['total_attempts']
+    streak = columns['streak']
+    practiced = total_attempts > 0
+    accuracy = np.where(practiced, columns['correct'] / np.maximum(total_attempts, 1) * 100, 0.0)
+
+    accuracy_points = np.select(
+        [accuracy >= 90, accuracy >= 80, accuracy >= 70, accuracy >= 60,
+         accuracy >= 50, accuracy >= 40, accuracy >= 30, accuracy >= 20],
+        [5.0, 4.0, 3.5, 3.0, 2.5, 2.0, 1.5, 1.0],
+        default=0.5
+    )
+    consistency_bonus = np.select(
+        [streak >= 5, streak >= 3, streak >= 1, streak == 0, streak >= -2, streak >= -4],
+        [1.0, 0.5, 0.2, 0.0, -0.3, -0.6],
+        default=-1.0
+    )
+    experience_modifier = np.select(
+        [total_attempts >= 10, total_attempts >= 5, total_attempts >= 3],
+        [1.0, 0.8, 0.6],
+        default=0.4
+    )
+
+    # Whole days, rounded down like the scalar path
+    days_since = np.floor((now_epoch - columns['last_practiced']) / 86400)
+    recency_modifier = np.select(
+        [np.isnan(days_since), days_since <= 1, days_since <= 3,
+         days_since <= 7, days_since <= 14, days_since <= 30],
+        [1.0, 1.0, 0.95, 0.9, 0.8, 0.7],
+        default=0.6
+    )
+
+    mastery_score = (accuracy_points + consistency_bonus) * experience_modifier * recency_modifier
+    levels = np.select(
+        [(mastery_score >= 5.5) & (accuracy >= 90) & (total_attempts >= 5),
+         mastery_score >= 4.5, mastery_score >= 3.5, mastery_score >= 2.5, mastery_score >= 1.5],
+        [5, 4, 3, 2, 1],
+        default=0
+    )
+    return np.where(practiced, levels, 0)
+
+
+def batch_base_priorities(columns: Dict):
+    """Time-independent part of the review priority, same rules as _base_priority"""
+    total_attempts = columns['total_attempts']
+    accuracy = columns['correct'] / np.maximum(total_attempts, 1)
+
+    priority = 50 + np.select(
+        [accuracy < 0.5, accuracy < 0.7, accuracy < 0.85],
+        [40, 25, 10],
+        default=-15
+    )
+    priority = priority + (5 - columns['mastery_level']) * 8
+    priority = priority + np.where((columns['streak'] == 0) & (total_attempts > 0), 30, 0)
+    return priority
+
+
+def batch_priorities(base_priorities, last_epochs, intervals, now_epoch: float):
+    """
+    Full review priority from base priorities, last practice epochs (NaN if
+    unknown) and review intervals in hours, same rules as _timing_priority
+    """
+    hours_ago = (now_epoch - last_epochs) / 3600
+    timing = np.select(
+        [np.isnan(hours_ago), hours_ago >= intervals * 1.2, hours_ago >= intervals,
+         hours_ago >= intervals * 0.8, hours_ago < intervals * 0.3],
+        [0, 25, 15, 5, -30],
+        default=0
+    )
+    return np.maximum(0, base_priorities + timing)
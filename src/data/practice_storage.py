@@ -0,0 +1,395 @@
+"""
+Storage engines for word practice statistics
+
+WordPracticeDatabase keeps its working copy in memory and hands every
+change to one of these engines as an event:
+- JsonStorage: JSON snapshot plus an append-only journal (default)
+- SqliteStorage: stdlib sqlite3 database with indexed tables
+"""
+import json
+import os
+import sqlite3
+from typing import Dict, List, Iterator, Optional
+
+
+class JsonStorage:
+    """JSON snapshot file with an append-only journal of events"""
+
+    def __init__(self, db_file: str, compact_every: int = 500):
+        self.db_file = db_file
+        # Append-only log of changes made since the last full snapshot
+        self.journal_file = os.path.splitext(db_file)[0] + '.journal'
+        self.compact_every = compact_every
+        self._journal_entries = 0
+
+    def exists(self) -> bool:
+        """Check if a snapshot or journal has been written"""
+        return os.path.exists(self.db_file) or os.path.exists(self.journal_file)
+
+    def load(self) -> Optional[Dict]:
+        """Load the snapshot, or None if there is nothing usable on disk"""
+        if not os.path.exists(self.db_file):
+            return None
+
+        try:
+            with open(self.db_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except json.JSONDecodeError:
+            print(f"⚠️  Warning: Could not read {self.db_file}, creating new database")
+            return None
+
+        data.setdefault('journal_seq', 0)
+        return data
+
+    def pending_events(self, data: Dict) -> Iterator[Dict]:
+        """Yield journal events written after the snapshot in `data`"""
+        data.setdefault('journal_seq', 0)
+        if not os.path.exists(self.journal_file):
+            return
+
+        torn_at = None
+        with open(self.journal_file, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    # Partially written last line after a crash
+                    torn_at = f.tell() - len(line)
+                    break
+                try:
+                    event = json.loads(line.decode('utf-8'))
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    continue
+
+                self._journal_entries += 1
+                # Events already folded into the snapshot are skipped
+                if event.get('seq', 0) <= data['journal_seq']:
+                    continue
+                yield event
+                data['journal_seq'] = event['seq']
+
+        if torn_at is not None:
+            # Cut the torn line off, or the next append would be written onto it
+            with open(self.journal_file, 'r+b') as f:
+                f.truncate(torn_at)
+
+        if self._journal_entries >= self.compact_every:
+            self.compact(data)
+
+    def append(self, event: Dict, data: Dict):
+        """Append a single event to the journal instead of rewriting the whole file"""
+        data['journal_seq'] = data.get('journal_seq', 0) + 1
+        event['seq'] = data['journal_seq']
+
+        os.makedirs(os.path.dirname(self.journal_file), exist_ok=True)
+        with open(self.journal_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(event, ensure_ascii=False) + '\n')
+
+        self._journal_entries += 1
+        if self._journal_entries >= self.compact_every:
+            self.compact(data)
+
+    def save(self, data: Dict):
+        """
+        Write a full snapshot
+
+        The snapshot goes to a temporary file that replaces the old one in a
+        single rename, so a crash leaves either the old or the new file.
+        """
+        data.setdefault('journal_seq', 0)
+        os.makedirs(os.path.dirname(self.db_file), exist_ok=True)
+        temp_file = self.db_file + '.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.db_file)
+
+    def flush(self, events: List[Dict], data: Dict):
+        """Persist a batch of buffered events as one atomic snapshot"""
+        # `data` already contains the events, so the journal is not needed
+        self.compact(data)
+
+    def compact(self, data: Dict):
+        """Fold the journal into a fresh snapshot and start a new journal"""
+        self.save(data)
+        if os.path.exists(self.journal_file):
+            os.remove(self.journal_file)
+        self._journal_entries = 0
+
+    def reset(self):
+        """Delete the snapshot and journal"""
+        if os.path.exists(self.db_file):
+            os.remove(self.db_file)
+        if os.path.exists(self.journal_file):
+            os.remove(self.journal_file)
+        self._journal_entries = 0
+
+    def session_history(self, data: Dict, limit: int) -> List[Dict]:
+        """Most recent sessions first"""
+        sessions = sorted(
+            data['sessions'],
+            key=lambda s: s['start_time'],
+            reverse=True
+        )
+        return sessions[:limit]
+
+
+class SqliteStorage:
+    """SQLite database with words, attempts and sessions tables"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS words (
+            russian TEXT PRIMARY KEY,
+            english TEXT,
+            translation TEXT,
+            total_attempts INTEGER NOT NULL DEFAULT 0,
+            correct INTEGER NOT NULL DEFAULT 0,
+            incorrect INTEGER NOT NULL DEFAULT 0,
+            streak INTEGER NOT NULL DEFAULT 0,
+            mastery_level INTEGER NOT NULL DEFAULT 0,
+            first_seen TIMESTAMP,
+            last_practiced TIMESTAMP
+        );
+        -- Statistics and due/weak word selection run over the rows loaded
+        -- into memory (shared with the JSON backend), so words needs no
+        -- secondary indexes; files from earlier versions drop theirs
+        DROP INDEX IF EXISTS idx_words_mastery_level;
+        DROP INDEX IF EXISTS idx_words_last_practiced;
+
+        CREATE TABLE IF NOT EXISTS attempts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            russian TEXT NOT NULL,
+            date TIMESTAMP,
+            correct INTEGER NOT NULL,
+            user_answer TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_attempts_russian ON attempts(russian, id);
+
+        CREATE TABLE IF NOT EXISTS sessions (
+            id INTEGER PRIMARY KEY,
+            start_time TIMESTAMP,
+            end_time TIMESTAMP,
+            correct_count INTEGER NOT NULL DEFAULT 0,
+            incorrect_count INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS idx_sessions_start_time ON sessions(start_time);
+
+        CREATE TABLE IF NOT EXISTS session_words (
+            session_id INTEGER NOT NULL,
+            position INTEGER NOT NULL,
+            russian TEXT NOT NULL,
+            PRIMARY KEY (session_id, russian)
+        );
+    """
+
+    WORD_COLUMNS = (
+        'russian', 'english', 'translation', 'total_attempts', 'correct', 'incorrect',
+        'streak', 'mastery_level', 'first_seen', 'last_practiced'
+    )
+
+    # Attempts per word loaded into memory, matching the JSON records
+    # (the attempts table itself keeps every attempt)
+    HISTORY_LENGTH = 20
+
+    def __init__(self, db_file: str):
+        self.db_file = db_file
+        self._existed = os.path.exists(db_file)
+        self.conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and make sure the schema exists"""
+        os.makedirs(os.path.dirname(self.db_file), exist_ok=True)
+        conn = sqlite3.connect(self.db_file)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(self.SCHEMA)
+        # Stats layout revision of the stored rows (0 = not recorded yet)
+        self._user_version = conn.execute("PRAGMA user_version").fetchone()[0]
+        return conn
+
+    def _record_version(self, data: Dict):
+        """Remember which stats layout revision the rows are in"""
+        version = data.get('schema_version', 1)
+        if version != self._user_version:
+            self.conn.execute(f"PRAGMA user_version = {int(version)}")
+            self._user_version = version
+
+    def exists(self) -> bool:
+        """Check if the database file was already present when opened"""
+        return self._existed
+
+    def load(self) -> Optional[Dict]:
+        """
+        Read the rows into the in-memory structure used by WordPracticeDatabase
+
+        Only the last HISTORY_LENGTH attempts of each word are read.
+        """
+        if not self._existed:
+            return None
+
+        words = {}
+        for row in self.conn.execute("SELECT * FROM words"):
+            word_data = dict(row)
+            word_data['attempts_history'] = []
+            words[row['russian']] = word_data
+
+        recent_attempts = """
+            SELECT russian, date, correct, user_answer FROM (
+                SELECT *, ROW_NUMBER() OVER (PARTITION BY russian ORDER BY id DESC) AS age
+                FROM attempts
+            ) WHERE age <= ? ORDER BY id
+        """
+        for row in self.conn.execute(recent_attempts, (self.HISTORY_LENGTH,)):
+            if row['russian'] in words:
+                words[row['russian']]['attempts_history'].append({
+                    'date': row['date'],
+                    'correct': bool(row['correct']),
+                    'user_answer': row['user_answer']
+                })
+
+        sessions = [self._session_from_row(row) for row in
+                    self.conn.execute("SELECT * FROM sessions ORDER BY id")]
+        by_id = {session['id']: session for session in sessions}
+        for row in self.conn.execute(
+            "SELECT session_id, russian FROM session_words ORDER BY session_id, position"
+        ):
+            if row['session_id'] in by_id:
+                by_id[row['session_id']]['words_practiced'].append(row['russian'])
+
+        return {
+            # Rows written before the revision was recorded are layout 1
+            'schema_version': self._user_version or 1,
+            'words': words,
+            'sessions': sessions
+        }
+
+    def pending_events(self, data: Dict) -> Iterator[Dict]:
+        """Every change is committed as it happens, so nothing is pending"""
+        return iter(())
+
+    def append(self, event: Dict, data: Dict):
+        """Persist a single event as row updates in one transaction"""
+        with self.conn:
+            self._record_version(data)
+            self._write_event(event, data)
+
+    def flush(self, events: List[Dict], data: Dict):
+        """Persist a batch of buffered events in one transaction"""
+        with self.conn:
+            self._record_version(data)
+            for event in events:
+                self._write_event(event, data)
+
+    def _write_event(self, event: Dict, data: Dict):
+        """Translate an event into row updates"""
+        op = event['op']
+        if op == 'attempt':
+            self._upsert_word(data['words'][event['russian']])
+            self.conn.execute(
+                "INSERT INTO attempts (russian, date, correct, user_answer) VALUES (?, ?, ?, ?)",
+                (event['russian'], event['time'], int(event['correct']), event['user_answer'])
+            )
+        elif op == 'start_session':
+            self.conn.execute(
+                "INSERT INTO sessions (id, start_time) VALUES (?, ?)",
+                (event['id'], event['time'])
+            )
+        elif op == 'session_word':
+            self.conn.execute(
+                "INSERT OR IGNORE INTO session_words (session_id, position, russian) "
+                "VALUES (?, (SELECT COUNT(*) FROM session_words WHERE session_id = ?), ?)",
+                (event['id'], event['id'], event['russian'])
+            )
+        elif op == 'end_session':
+            self.conn.execute(
+                "UPDATE sessions SET end_time = ?, correct_count = ?, incorrect_count = ? WHERE id = ?",
+                (event['time'], event['correct_count'], event['incorrect_count'], event['id'])
+            )
+
+    def _upsert_word(self, word_data: Dict):
+        """Insert or replace the summary row for one word"""
+        placeholders = ', '.join('?' for _ in self.WORD_COLUMNS)
+        self.conn.execute(
+            f"INSERT OR REPLACE INTO words ({', '.join(self.WORD_COLUMNS)}) VALUES ({placeholders})",
+            tuple(word_data.get(column) for column in self.WORD_COLUMNS)
+        )
+
+    def save(self, data: Dict):
+        """
+        Write every word and session in `data` as row upserts
+
+        Attempts are append-only and already stored as they happen, so only
+        words without any attempt rows (statistics carried over from JSON)
+        get theirs inserted; older attempts outside the in-memory history
+        are kept.
+        """
+        with self.conn:
+            self._record_version(data)
+            stored = {row[0] for row in self.conn.execute("SELECT DISTINCT russian FROM attempts")}
+
+            for word_data in data['words'].values():
+                self._upsert_word(word_data)
+                if word_data['russian'] in stored:
+                    continue
+                self.conn.executemany(
+                    "INSERT INTO attempts (russian, date, correct, user_answer) VALUES (?, ?, ?, ?)",
+                    [(word_data['russian'], attempt['date'], int(attempt['correct']), attempt['user_answer'])
+                     for attempt in word_data.get('attempts_history', [])]
+                )
+
+            for session in data['sessions']:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO sessions (id, start_time, end_time, correct_count, incorrect_count) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (session['id'], session['start_time'], session['end_time'],
+                     session['correct_count'], session['incorrect_count'])
+                )
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO session_words (session_id, position, russian) VALUES (?, ?, ?)",
+                    [(session['id'], position, russian)
+                     for position, russian in enumerate(session['words_practiced'])]
+                )
+
+    def compact(self, data: Dict):
+        """Reclaim space left by deleted rows"""
+        self.conn.execute("VACUUM")
+
+    def reset(self):
+        """Delete the database file and start with empty tables"""
+        self.conn.close()
+        if os.path.exists(self.db_file):
+            os.remove(self.db_file)
+        self._existed = False
+        self.conn = self._connect()
+
+    def session_history(self, data: Dict, limit: int) -> List[Dict]:
+        """Most recent sessions first, read through the start_time index"""
+        sessions = [self._session_from_row(row) for row in self.conn.execute(
+            "SELECT * FROM sessions ORDER BY start_time DESC LIMIT ?", (limit,)
+        )]
+        self._attach_session_words(sessions)
+        return sessions
+
+    def _session_from_row(self, row: sqlite3.Row) -> Dict:
+        """Build a session record in the JSON layout"""
+        return {
+            'id': row['id'],
+            'start_time': row['start_time'],
+            'end_time': row['end_time'],
+            'words_practiced': [],
+            'correct_count': row['correct_count'],
+            'incorrect_count': row['incorrect_count']
+        }
+
+    def _attach_session_words(self, sessions: List[Dict]):
+        """Fill in words_practiced for a small set of sessions"""
+        by_id = {session['id']: session for session in sessions}
+        if not by_id:
+            return
+
+        placeholders = ', '.join('?' for _ in by_id)
+        rows = self.conn.execute(
+            f"SELECT session_id, russian FROM session_words "
+            f"WHERE session_id IN ({placeholders}) ORDER BY session_id, position",
+            tuple(by_id)
+        )
+        for row in rows:
+            by_id[row['session_id']]['words_practiced'].append(row['russian'])
@@ -0,0 +1,153 @@
+"""
+Process-wide registry of the tutor's datasets
+
+Menu actions used to build fresh databases every time they were entered.
+The registry builds each dataset once, on first use, and hands the same
+instance to every caller for the rest of the process. Callers treat the
+datasets as read-only; after changing the underlying files call
+invalidate() to have them rebuilt on next use. Datasets built from other
+datasets are dropped together with their sources, and the practice
+database is flushed before it is let go.
+
+    from data.registry import get_registry
+    noun_db = get_registry().noun_db
+"""
+from typing import Callable, Dict, Iterator, Optional
+from data.adjective_database import AdjectiveDatabase
+from data.form_index import FormIndex
+from data.lexicon import Lexicon
+from data.noun_database import NounDatabase
+from data.pronoun_database import PronounDatabase
+from data.verb_database import VerbDatabase
+from data.word_pair_database import WordPairDatabase
+from data.word_practice_database import WordPracticeDatabase
+
+# Datasets built from other datasets, dropped together with them
+DEPENDENTS = {
+    'noun_db': ('form_index',),
+    'adjective_db': ('form_index',),
+    'pronoun_db': ('form_index',),
+    'verb_db': ('form_index',),
+    'form_index': ('word_practice_english', 'word_practice_norwegian'),
+    'lexicon': ('form_index', 'vocabulary_noun_db', 'vocabulary_adjective_db', 'vocabulary_verb_db',
+                'word_practice_english', 'word_practice_norwegian'),
+    'practice_db': ('word_practice_english', 'word_practice_norwegian')
+}
+
+
+class DataRegistry:
+    """Lazily built, shared datasets for one process"""
+
+    def __init__(self):
+        self._datasets: Dict[str, object] = {}
+
+    def _get(self, name: str, factory: Callable[[], object]):
+        if name not in self._datasets:
+            self._datasets[name] = factory()
+        return self._datasets[name]
+
+    @property
+    def noun_db(self) -> NounDatabase:
+        return self._get('noun_db', NounDatabase)
+
+    @property
+    def vocabulary_noun_db(self) -> NounDatabase:
+        """The drill nouns plus the declinable nouns of the vocabulary lexicon"""
+        def build():
+            noun_db = NounDatabase()
+            # Streamed from the SMARTool CSV (the source with noun tags), so the
+            # noun drill does not have to build the merged lexicon
+            noun_db.add_vocabulary_nouns(self.lexicon.sources['english'].iter_words(pos='N'))
+            return noun_db
+        return self._get('vocabulary_noun_db', build)
+
+    @property
+    def adjective_db(self) -> AdjectiveDatabase:
+        return self._get('adjective_db', AdjectiveDatabase)
+
+    @property
+    def vocabulary_adjective_db(self) -> AdjectiveDatabase:
+        """The drill adjectives plus the declinable adjectives of the vocabulary lexicon"""
+        def build():
+            adjective_db = AdjectiveDatabase()
+            adjective_db.add_vocabulary_adjectives(self.lexicon.sources['english'].iter_words(pos='A'))
+            return adjective_db
+        return self._get('vocabulary_adjective_db', build)
+
+    @property
+    def pronoun_db(self) -> PronounDatabase:
+        return self._get('pronoun_db', PronounDatabase)
+
+    @property
+    def pair_db(self) -> WordPairDatabase:
+        return self._get('pair_db', WordPairDatabase)
+
+    @property
+    def verb_db(self) -> VerbDatabase:
+        return self._get('verb_db', VerbDatabase)
+
+    @property
+    def vocabulary_verb_db(self) -> VerbDatabase:
+        """The drill verbs plus the conjugatable verbs of the vocabulary lexicon"""
+        def build():
+            verb_db = VerbDatabase()
+            verb_db.add_vocabulary_verbs(self.lexicon.sources['english'].iter_words(pos='V'))
+            return verb_db
+        return self._get('vocabulary_verb_db', build)
+
+    @property
+    def lexicon(self) -> Lexicon:
+        """Merged vocabulary; loads quietly, callers show what load() did when they want to"""
+        return self._get('lexicon', lambda: Lexicon(quiet=True))
+
+    @property
+    def practice_db(self) -> WordPracticeDatabase:
+        """Practice statistics, buffered; shared by both practice languages"""
+        return self._get('practice_db', lambda: WordPracticeDatabase(buffered=True))
+
+    @property
+    def form_index(self) -> FormIndex:
+        """Form lookups over the grammar databases; autocomplete also knows the vocabulary lemmas"""
+        return self._get('form_index', lambda: FormIndex(self.noun_db, self.adjective_db, self.pronoun_db,
+                                                         self.verb_db, vocabulary=self._vocabulary_lemmas))
+
+    def _vocabulary_lemmas(self) -> Iterator[str]:
+        """Every vocabulary lemma, streamed from both CSVs without loading the lexicon"""
+        for source in self.lexicon.sources.values():
+            for word in source.iter_words():
+                yield word.russian
+
+    def word_practice(self, use_norwegian: bool = False):
+        """The word practice session runner for one language"""
+        # Imported here: quiz.word_practice is a consumer of the data package
+        from quiz.word_practice import WordPractice
+
+        language = 'norwegian' if use_norwegian else 'english'
+        return self._get('word_practice_' + language,
+                         lambda: WordPractice(use_norwegian, lexicon=self.lexicon, db=self.practice_db,
+                                              form_index=self.form_index))
+
+    def invalidate(self, name: Optional[str] = None):
+        """Drop one dataset (and what was built from it), or all of them"""
+        names = list(self._datasets) if name is None else [name]
+        while names:
+            dropped = names.pop()
+            names.extend(DEPENDENTS.get(dropped, ()))
+            dataset = self._datasets.pop(dropped, None)
+            if isinstance(dataset, WordPracticeDatabase):
+                # Buffered attempts would otherwise only reach disk at exit
+                dataset.flush()
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._datasets
+
+
+_registry: Optional[DataRegistry] = None
+
+
+def get_registry() -> DataRegistry:
+    """The process-wide registry, created on first use"""
+    global _registry
+    if _registry is None:
+        _registry = DataRegistry()
+    return _registry
@@ -1,29 +1,21 @@
 import csv
-import os
-from typing import List, Dict
+import hashlib
+import io
+import time
+from typing import Iterator, List, Dict, Optional
+from data import vocabulary_snapshot
+from data.load_report import LoadReport
+from data.vocabulary_entry import VocabEntry
+from data.vocabulary_index import pos_matches
+from data.vocabulary_source import VocabularySource
 
-class RussianNorwegianExtractor:
+class RussianNorwegianExtractor(VocabularySource):
     """Extract vocabulary words from Russian-Norwegian CSV data"""
     
-    def __init__(self, csv_file: str = "russisk_norsk.csv"):
-        self.csv_file = os.path.join(os.path.dirname(__file__), csv_file)
+    DELIMITER = ';'
     
-    def check_csv_file(self) -> bool:
-        """Check if CSV file exists and is readable"""
-        if not os.path.exists(self.csv_file):
-            print(f"\n❌ CSV file not found: {self.csv_file}")
-            return False
-        
-        try:
-            with open(self.csv_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f, delimiter=';')
-                # Try to read first row
-                next(reader)
-            print(f"✅ CSV file found and readable: {self.csv_file}")
-            return True
-        except Exception as e:
-            print(f"❌ Error reading CSV: {e}")
-            return False
+    def __init__(self, csv_file: str = "russisk_norsk.csv", quiet: bool = False):
+        super().__init__(csv_file, quiet)
     
     def _extract_verb_info(self, russian: str, norwegian: str) -> Dict:
         """Extract verb aspect and base form from Norwegian translation"""
@@ -50,82 +42,181 @@ class RussianNorwegianExtractor:
             'aspect': aspect
         }
     
-    def extract_unique_words(self) -> List[Dict]:
+    def _load_words(self, report: LoadReport) -> Optional[List[VocabEntry]]:
+        """
+        Load words from the binary snapshot, parsing only rows appended since
+        it was written; a CSV that was rewritten is parsed again in full
+        """
+        snapshot = vocabulary_snapshot.read_snapshot(self.csv_file)
+        if snapshot is not None:
+            words = self._load_appended(snapshot, report)
+            if words is not None:
+                return words
+        return self.rebuild_snapshot(report)
+    
+    def _load_appended(self, snapshot: Dict, report: LoadReport) -> Optional[List[VocabEntry]]:
         """
-        Extract Russian words with Norwegian translations
-        Returns list of dicts: {russian: str, norwegian: str, pos: str, aspect: str (for verbs)}
+        Snapshot words plus any rows appended to the CSV since, or None if
+        the part of the file the snapshot covers is no longer the same
         """
-        words_list = []
+        offset = snapshot.get('offset')
+        if offset is None:
+            return None
         
-        if not os.path.exists(self.csv_file):
-            print(f"\n❌ Error: Could not find CSV file at: {self.csv_file}")
-            return []
+        with open(self.csv_file, 'rb') as f:
+            header = f.readline()
+            if vocabulary_snapshot.header_fingerprint(header) != snapshot.get('header'):
+                return None
+            
+            # The snapshot still applies only if its bytes are untouched and
+            # ended on a row boundary
+            f.seek(0)
+            digest = hashlib.sha1()
+            last_byte = b''
+            remaining = offset
+            while remaining > 0:
+                block = f.read(min(1 << 20, remaining))
+                if not block:
+                    return None
+                digest.update(block)
+                last_byte = block[-1:]
+                remaining -= len(block)
+            if digest.hexdigest() != snapshot['hash']:
+                return None
+            
+            tail = f.read()
         
+        words = vocabulary_snapshot.snapshot_words(snapshot)
+        if not tail:
+            report.cache = 'snapshot'
+            return words
+        if last_byte not in (b'\n', b'\r'):
+            return None
+        
+        started = time.perf_counter()
         try:
-            with open(self.csv_file, 'r', encoding='utf-8') as f:
+            fieldnames = next(csv.reader([header.decode('utf-8')], delimiter=';'))
+            reader = csv.reader(io.StringIO(tail.decode('utf-8'), newline=''), delimiter=';')
+            appended = list(self._iter_rows(reader, fieldnames, report))
+        except (UnicodeDecodeError, csv.Error):
+            report.rows_processed = 0
+            return None
+        
+        report.cache = 'append'
+        report.bytes_parsed = len(tail)
+        report.parse_seconds = time.perf_counter() - started
+        report.finish_rows(len(appended))
+        
+        words.extend(appended)
+        digest.update(tail)
+        vocabulary_snapshot.save_snapshot(self.csv_file, digest.hexdigest(), words,
+                                          offset=offset + len(tail), header=snapshot['header'])
+        return words
+    
+    def rebuild_snapshot(self, report: Optional[LoadReport] = None) -> Optional[List[VocabEntry]]:
+        """Parse the whole CSV and store the result as its snapshot"""
+        parsed = self._parse_csv(report, with_offset=True)
+        if parsed is None:
+            return None
+        
+        words, offset, header = parsed
+        vocabulary_snapshot.save_snapshot(
+            self.csv_file, vocabulary_snapshot.content_hash(self.csv_file, offset), words,
+            offset=offset, header=vocabulary_snapshot.header_fingerprint(header)
+        )
+        return words
+    
+    def _parse_csv(self, report: Optional[LoadReport] = None, with_offset: bool = False):
+        """
+        Read words from the CSV file, or None if it cannot be read; row
+        counts, bytes and timing go into report
+        
+        With with_offset, returns (words, bytes parsed, raw header line).
+        """
+        report = report or LoadReport(self.csv_file)
+        started = time.perf_counter()
+        
+        try:
+            with open(self.csv_file, 'rb') as raw:
+                header = raw.readline()
+                raw.seek(0)
+                f = io.TextIOWrapper(raw, encoding='utf-8', newline='')
                 # Use semicolon as delimiter
-                reader = csv.DictReader(f, delimiter=';')
-                
-                rows_processed = 0
-                rows_added = 0
-                skipped_rows = 0
-                
-                for row in reader:
-                    rows_processed += 1
-                    
-                    # Safely get values with default empty string
-                    russian = (row.get('russisk') or '').strip()
-                    norwegian = (row.get('norsk') or '').strip()
-                    
-                    # Skip empty entries
-                    if not russian or not norwegian:
-                        skipped_rows += 1
-                        continue
-                    
-                    # Extract verb information
-                    verb_info = self._extract_verb_info(russian, norwegian)
-                    
-                    word_data = {
-                        'russian': russian,
-                        'norwegian': norwegian,
-                        'pos': 'V' if verb_info['is_verb'] else 'N/A',
-                        'level': 'N/A'
-                    }
-                    
-                    # Add aspect information for verbs
-                    if verb_info['is_verb']:
-                        word_data['aspect'] = verb_info['aspect']
-                    
-                    words_list.append(word_data)
-                    rows_added += 1
-                
-                print(f"\n📊 CSV Processing Summary:")
-                print(f"   Total rows processed: {rows_processed}")
-                print(f"   Words extracted: {rows_added}")
-                if skipped_rows > 0:
-                    print(f"   Skipped rows (empty/incomplete): {skipped_rows}")
-                
+                reader = csv.reader(f, delimiter=';')
+                fieldnames = next(reader, [])
+                words_list = list(self._iter_rows(reader, fieldnames, report))
+                offset = raw.tell()
         except Exception as e:
-            print(f"\n❌ Error reading CSV file: {e}")
-            import traceback
-            traceback.print_exc()
-            return []
+            report.error = f"Error reading CSV file: {e}"
+            self._print(f"\n❌ Error reading CSV file: {e}")
+            if not self.quiet:
+                import traceback
+                traceback.print_exc()
+            return None
         
+        report.bytes_parsed = offset
+        report.parse_seconds = time.perf_counter() - started
+        report.finish_rows(len(words_list))
+        
+        if with_offset:
+            return words_list, offset, header
         return words_list
     
-    def get_words_by_pos(self, pos: str) -> List[Dict]:
-        """Get words filtered by part of speech (V for verbs, N/A for others)"""
-        all_words = self.extract_unique_words()
-        if pos == 'V':
-            return [w for w in all_words if w['pos'] == 'V']
-        else:
-            return [w for w in all_words if w['pos'] != 'V']
+    def _iter_csv(self, report: Optional[LoadReport] = None, pos: Optional[str] = None,
+                  level: Optional[str] = None, aspect: Optional[str] = None) -> Iterator[VocabEntry]:
+        """Yield every complete row that passes the filters"""
+        with open(self.csv_file, 'r', encoding='utf-8', newline='') as f:
+            # Use semicolon as delimiter
+            reader = csv.reader(f, delimiter=';')
+            fieldnames = next(reader, [])
+            yield from self._iter_rows(reader, fieldnames, report, pos, level, aspect)
     
-    def get_verbs(self) -> List[Dict]:
-        """Get all verbs with aspect information"""
-        return self.get_words_by_pos('V')
+    def _iter_rows(self, reader, fieldnames: List[str], report: Optional[LoadReport] = None,
+                   pos: Optional[str] = None, level: Optional[str] = None,
+                   aspect: Optional[str] = None) -> Iterator[VocabEntry]:
+        """Turn csv.reader rows under the given header into VocabEntry records"""
+        russian_column = fieldnames.index('russisk') if 'russisk' in fieldnames else None
+        norwegian_column = fieldnames.index('norsk') if 'norsk' in fieldnames else None
+        
+        for row in reader:
+            # Blank lines are not rows (same as csv.DictReader)
+            if not row:
+                continue
+            if report is not None:
+                report.rows_processed += 1
+            
+            # Safely get values with default empty string
+            russian = row[russian_column].strip() if russian_column is not None and russian_column < len(row) else ''
+            norwegian = row[norwegian_column].strip() if norwegian_column is not None and norwegian_column < len(row) else ''
+            
+            # Skip empty entries
+            if not russian or not norwegian:
+                continue
+            
+            # Extract verb information
+            verb_info = self._extract_verb_info(russian, norwegian)
+            
+            word_data = VocabEntry(
+                russian,
+                norwegian=norwegian,
+                pos='V' if verb_info['is_verb'] else 'N/A',
+                level='N/A',
+                # Add aspect information for verbs
+                aspect=verb_info['aspect'] if verb_info['is_verb'] else None
+            )
+            
+            # Same filters as query()
+            if pos and not pos_matches(word_data.pos, pos):
+                continue
+            if level is not None and word_data.level != level:
+                continue
+            if aspect is not None and (word_data.get('aspect') or '').lower() != aspect.lower():
+                continue
+            
+            yield word_data
     
-    def get_verbs_by_aspect(self, aspect: str) -> List[Dict]:
-        """Get verbs filtered by aspect (perfective/imperfective)"""
-        verbs = self.get_verbs()
-        return [v for v in verbs if v.get('aspect', '').lower() == aspect.lower()]
\ No newline at end of file
+    def get_words_by_pos(self, pos: str) -> List[VocabEntry]:
+        """Get words filtered by part of speech (V for verbs, N/A for others)"""
+        # Every word is tagged either 'V' or 'N/A'
+        return self.query(pos='V' if pos == 'V' else 'N/A')
+    
\ No newline at end of file
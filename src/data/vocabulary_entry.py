@@ -0,0 +1,56 @@
+import sys
+from typing import Dict, Optional
+
+
+class VocabEntry:
+    """
+    One vocabulary word as produced by the extractors
+
+    Slotted, with the small set of POS, level and aspect values interned, so
+    large vocabularies cost a fraction of the equivalent dicts. Fields a word
+    does not have are None. Dict-style access (word['russian'],
+    word.get('aspect'), 'aspect' in word) keeps working for existing callers.
+    """
+
+    __slots__ = ('russian', 'english', 'norwegian', 'pos', 'level', 'aspect')
+
+    def __init__(self, russian: str, english: Optional[str] = None, norwegian: Optional[str] = None,
+                 pos: Optional[str] = None, level: Optional[str] = None, aspect: Optional[str] = None):
+        self.russian = russian
+        self.english = english
+        self.norwegian = norwegian
+        self.pos = None if pos is None else sys.intern(pos)
+        self.level = None if level is None else sys.intern(level)
+        self.aspect = None if aspect is None else sys.intern(aspect)
+
+    def get(self, field: str, default=None):
+        value = getattr(self, field, None) if field in self.__slots__ else None
+        return default if value is None else value
+
+    def __getitem__(self, field: str):
+        value = self.get(field)
+        if value is None:
+            raise KeyError(field)
+        return value
+
+    def __contains__(self, field: str) -> bool:
+        return self.get(field) is not None
+
+    def to_dict(self) -> Dict:
+        """Plain dict with only the fields this word has"""
+        return {field: getattr(self, field) for field in self.__slots__ if getattr(self, field) is not None}
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, VocabEntry):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+
+    def __hash__(self) -> int:
+        return hash(self.russian)
+
+    def __reduce__(self):
+        # Compact pickling for the parallel CSV parser's worker results
+        return (VocabEntry, tuple(getattr(self, field) for field in self.__slots__))
+
+    def __repr__(self) -> str:
+        return f"VocabEntry({self.to_dict()!r})"
@@ -1,29 +1,68 @@
 import csv
+import io
 import os
-from typing import List, Dict
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from operator import itemgetter
+from typing import Iterator, List, Optional, Tuple
+from data import vocabulary_snapshot
+from data.load_report import LoadReport
+from data.vocabulary_entry import VocabEntry
+from data.vocabulary_index import pos_matches
+from data.vocabulary_source import VocabularySource
 
-class VocabularyExtractor:
+# Files at least this large are parsed in parallel byte-range chunks
+PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+CHUNK_BYTES = 8 * 1024 * 1024
+
+# The only CSV columns read, in the order _iter_rows unpacks them
+COLUMNS = ('Target language lemma', 'English gloss', 'User language gloss', 'POS', 'Level', 'Analysis')
+
+
+def _project_columns(reader, header: List[str]) -> Iterator[Tuple[str, ...]]:
+    """
+    Yield just the COLUMNS cells of each csv.reader row, resolving the
+    header to column positions once; missing columns and cells read as ''
+    """
+    pad = len(header)
+    pick = itemgetter(*[header.index(column) if column in header else pad for column in COLUMNS])
+    width = pad + 1
+    
+    for row in reader:
+        # Blank lines are not rows (same as csv.DictReader)
+        if not row:
+            continue
+        if len(row) < width:
+            row.extend([''] * (width - len(row)))
+        yield pick(row)
+
+
+def _parse_chunk(csv_file: str, fieldnames: List[str], start: int, end: int) -> Tuple[int, List[VocabEntry]]:
+    """Parse the rows in one byte range; runs in a worker process"""
+    with open(csv_file, 'rb') as f:
+        f.seek(start)
+        text = f.read(end - start).decode('utf-8')
+    
+    report = LoadReport(csv_file)
+    rows = _project_columns(csv.reader(io.StringIO(text, newline='')), fieldnames)
+    words = list(VocabularyExtractor(csv_file)._iter_rows(rows, report))
+    return report.rows_processed, words
+
+
+class VocabularyExtractor(VocabularySource):
     """Extract unique vocabulary words from SMARTool CSV data"""
     
-    def __init__(self, csv_file: str = "SMARTool_data_A1.csv"):
-        self.csv_file = os.path.join(os.path.dirname(__file__), csv_file)
+    def __init__(self, csv_file: str = "SMARTool_data_A1.csv", workers: Optional[int] = None,
+                 quiet: bool = False):
+        super().__init__(csv_file, quiet)
+        # Worker processes for large files (None = one per CPU, 1 = never parallel)
+        self.workers = workers
     
-    def check_csv_file(self) -> bool:
-        """Check if CSV file exists and is readable"""
-        if not os.path.exists(self.csv_file):
-            print(f"\n❌ CSV file not found: {self.csv_file}")
-            return False
-        
-        try:
-            with open(self.csv_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                # Try to read first row
-                next(reader)
-            print(f"✅ CSV file found and readable: {self.csv_file}")
-            return True
-        except Exception as e:
-            print(f"❌ Error reading CSV: {e}")
-            return False
+    def _print_missing(self):
+        super()._print_missing()
+        self._print(f"   Expected location: {os.path.dirname(__file__)}")
+        self._print(f"   Looking for: SMARTool_data_A1.csv")
     
     def _extract_aspect_from_analysis(self, analysis: str) -> str:
         """Extract aspect (Perf/Imperf) from the Analysis column"""
@@ -37,87 +76,159 @@ class VocabularyExtractor:
             return 'imperfective'
         return 'unknown'
     
-    def extract_unique_words(self) -> List[Dict]:
+    def _load_words(self, report: LoadReport) -> Optional[List[VocabEntry]]:
+        """Load words from the binary snapshot, rebuilding it when the CSV changed"""
+        digest = vocabulary_snapshot.content_hash(self.csv_file)
+        words = vocabulary_snapshot.load_snapshot(self.csv_file, digest)
+        if words is not None:
+            report.cache = 'snapshot'
+            return words
+        return self.rebuild_snapshot(digest, report)
+    
+    def rebuild_snapshot(self, digest: Optional[str] = None,
+                         report: Optional[LoadReport] = None) -> Optional[List[VocabEntry]]:
+        """Parse the CSV and store the result as its snapshot"""
+        words = self._parse_csv(report or LoadReport(self.csv_file))
+        if words is not None:
+            digest = digest or vocabulary_snapshot.content_hash(self.csv_file)
+            vocabulary_snapshot.save_snapshot(self.csv_file, digest, words)
+        return words
+    
+    def _parse_csv(self, report: Optional[LoadReport] = None) -> Optional[List[VocabEntry]]:
         """
-        Extract unique Russian words with their English translations
-        Returns list of dicts: {russian: str, english: str, pos: str, level: str, aspect: str (for verbs)}
+        Read unique words from the CSV file, or None if it cannot be read;
+        row counts, bytes and timing go into report
         """
-        unique_words = {}
-        
-        if not os.path.exists(self.csv_file):
-            print(f"\n❌ Error: Could not find CSV file at: {self.csv_file}")
-            print(f"   Expected location: {os.path.dirname(__file__)}")
-            print(f"   Looking for: SMARTool_data_A1.csv")
-            return []
+        report = report or LoadReport(self.csv_file)
+        started = time.perf_counter()
         
         try:
-            with open(self.csv_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                
-                rows_processed = 0
-                rows_added = 0
-                
-                for row in reader:
-                    rows_processed += 1
-                    
-                    lemma = row.get('Target language lemma', '').strip()
-                    # First try 'English gloss', then fall back to 'User language gloss'
-                    english = row.get('English gloss', '').strip()
-                    if not english:
-                        english = row.get('User language gloss', '').strip()
-                    pos = row.get('POS', '').strip()
-                    level = row.get('Level', '').strip()
-                    analysis = row.get('Analysis', '').strip()
-                    
-                    # Skip empty entries
-                    if not lemma or not english:
-                        continue
-                    
-                    # Skip entries marked as deleted
-                    if lemma.lower() == 'deleted' or english.lower() == 'deleted':
-                        continue
-                    
-                    # Use lemma as key to ensure uniqueness
-                    if lemma not in unique_words:
-                        word_data = {
-                            'russian': lemma,
-                            'english': english,
-                            'pos': pos,
-                            'level': level
-                        }
-                        
-                        # Add aspect information for verbs
-                        if pos and pos.startswith('V'):
-                            word_data['aspect'] = self._extract_aspect_from_analysis(analysis)
-                        
-                        unique_words[lemma] = word_data
-                        rows_added += 1
-                
-                print(f"\n📊 CSV Processing Summary:")
-                print(f"   Total rows processed: {rows_processed}")
-                print(f"   Unique words extracted: {rows_added}")
-                
+            size = os.path.getsize(self.csv_file)
+            workers = self.workers or os.cpu_count() or 1
+            if workers > 1 and size >= PARALLEL_MIN_BYTES:
+                words = self._parse_parallel(report, workers)
+            else:
+                words = list(self._iter_csv(report))
         except Exception as e:
-            print(f"\n❌ Error reading CSV file: {e}")
-            return []
+            report.error = f"Error reading CSV file: {e}"
+            self._print(f"\n❌ Error reading CSV file: {e}")
+            return None
+        
+        report.bytes_parsed = size
+        report.parse_seconds = time.perf_counter() - started
+        report.finish_rows(len(words))
+        return words
+    
+    def _parse_parallel(self, report: LoadReport, workers: int) -> List[VocabEntry]:
+        """
+        Parse the CSV in byte-range chunks across worker processes
+        
+        Chunks are cut at line ends, so rows must not contain quoted
+        newlines (SMARTool exports do not). Each chunk is deduplicated in
+        its worker and the results are merged in file order, so the first
+        row of a lemma still wins.
+        """
+        with open(self.csv_file, 'rb') as f:
+            header = f.readline()
+            fieldnames = next(csv.reader([header.decode('utf-8')]))
+            size = os.fstat(f.fileno()).st_size
+            
+            ranges = []
+            start = f.tell()
+            while start < size:
+                end = min(start + CHUNK_BYTES, size)
+                if end < size:
+                    # Move the cut to the end of the row it falls in
+                    f.seek(end)
+                    f.readline()
+                    end = f.tell()
+                ranges.append((start, end))
+                start = end
+        
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(
+                    _parse_chunk,
+                    [self.csv_file] * len(ranges),
+                    [fieldnames] * len(ranges),
+                    [start for start, _ in ranges],
+                    [end for _, end in ranges]
+                ))
+        except (OSError, BrokenProcessPool) as e:
+            # No worker processes available here, or one died mid-parse;
+            # parse in this process instead
+            self._print(f"⚠️  Warning: Parallel parsing unavailable ({e}), parsing serially")
+            return list(self._iter_csv(report))
+        
+        unique_words = {}
+        for rows_processed, words in results:
+            report.rows_processed += rows_processed
+            for word_data in words:
+                unique_words.setdefault(word_data['russian'], word_data)
         
         return list(unique_words.values())
     
-    def get_words_by_pos(self, pos: str) -> List[Dict]:
-        """Get words filtered by part of speech (N, V, A, etc.)"""
-        all_words = self.extract_unique_words()
-        return [w for w in all_words if w['pos'].startswith(pos)]
+    def _iter_csv(self, report: Optional[LoadReport] = None, pos: Optional[str] = None,
+                  level: Optional[str] = None, aspect: Optional[str] = None) -> Iterator[VocabEntry]:
+        """Yield the first row of each lemma that passes the filters"""
+        with open(self.csv_file, 'r', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            yield from self._iter_rows(_project_columns(reader, header), report, pos, level, aspect)
     
-    def get_words_by_level(self, level: str = 'A1') -> List[Dict]:
-        """Get words filtered by CEFR level"""
-        all_words = self.extract_unique_words()
-        return [w for w in all_words if w['level'] == level]
+    def _iter_rows(self, rows, report: Optional[LoadReport] = None, pos: Optional[str] = None,
+                   level: Optional[str] = None, aspect: Optional[str] = None) -> Iterator[VocabEntry]:
+        """
+        Turn rows of COLUMNS cells into VocabEntry records, keeping the first
+        row of each lemma
+        """
+        seen = set()
+        
+        for lemma, english, user_gloss, word_pos, word_level, analysis in rows:
+            if report is not None:
+                report.rows_processed += 1
+            
+            lemma = lemma.strip()
+            # First try 'English gloss', then fall back to 'User language gloss'
+            english = english.strip()
+            if not english:
+                english = user_gloss.strip()
+            
+            # Skip empty entries
+            if not lemma or not english:
+                continue
+            
+            # Skip entries marked as deleted
+            if lemma.lower() == 'deleted' or english.lower() == 'deleted':
+                continue
+            
+            # Use lemma as key to ensure uniqueness; a lemma's first row
+            # decides whether it passes the filters
+            if lemma in seen:
+                continue
+            seen.add(lemma)
+            
+            word_pos = word_pos.strip()
+            word_level = word_level.strip()
+            if pos and not pos_matches(word_pos, pos):
+                continue
+            if level is not None and word_level != level:
+                continue
+            
+            # Add aspect information for verbs
+            word_aspect = None
+            if word_pos and word_pos.startswith('V'):
+                word_aspect = self._extract_aspect_from_analysis(analysis.strip())
+            if aspect is not None and (word_aspect or '').lower() != aspect.lower():
+                continue
+            
+            yield VocabEntry(lemma, english=english, pos=word_pos, level=word_level, aspect=word_aspect)
     
-    def get_verbs(self) -> List[Dict]:
-        """Get all verbs with aspect information"""
-        return self.get_words_by_pos('V')
+    def get_words_by_pos(self, pos: str) -> List[VocabEntry]:
+        """Get words filtered by part of speech (N, V, A, etc.)"""
+        return self.query(pos=pos)
     
-    def get_verbs_by_aspect(self, aspect: str) -> List[Dict]:
-        """Get verbs filtered by aspect (perfective/imperfective)"""
-        verbs = self.get_verbs()
-        return [v for v in verbs if v.get('aspect', '').lower() == aspect.lower()]
\ No newline at end of file
+    def get_words_by_level(self, level: str = 'A1') -> List[VocabEntry]:
+        """Get words filtered by CEFR level"""
+        return self.query(level=level)
+    
\ No newline at end of file
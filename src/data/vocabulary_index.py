@@ -0,0 +1,65 @@
+from collections import defaultdict
+from typing import List, Optional
+from data.vocabulary_entry import VocabEntry
+
+
+def pos_matches(tag: str, pos: str) -> bool:
+    """
+    Whether pos is the leading dot-separated segments of a POS tag: 'N' and
+    'N.Fem' match N.Fem.Inan, 'N.Fe' does not
+    """
+    return (tag + '.').startswith(pos + '.')
+
+
+class VocabularyIndex:
+    """POS, CEFR level and aspect indexes over an extracted word list"""
+
+    def __init__(self, words: List[VocabEntry]):
+        self.words = words
+        # The whole-segment prefixes of a POS tag ('N', 'N.Masc', 'N.Masc.Inan')
+        # map to its words, so filters like get_words_by_pos('N') are lookups
+        self.by_pos_prefix = defaultdict(list)
+        self.by_level = defaultdict(list)
+        self.by_aspect = defaultdict(list)
+
+        for word in words:
+            pos = word.get('pos', '')
+            segments = pos.split('.')
+            for end in range(1, len(segments) + 1):
+                self.by_pos_prefix['.'.join(segments[:end])].append(word)
+            self.by_level[word.get('level', '')].append(word)
+            if 'aspect' in word:
+                self.by_aspect[word['aspect'].lower()].append(word)
+
+    def query(self, pos: Optional[str] = None, level: Optional[str] = None,
+              aspect: Optional[str] = None) -> List[VocabEntry]:
+        """
+        Words matching every given filter, in extraction order
+
+        pos matches the leading dot-separated segments of the POS tag ('N'
+        and 'N.Fem' both match N.Fem.Inan; 'N.Fe' and 'N/' match nothing),
+        level exactly and aspect case-insensitively. A single filter is one
+        dictionary lookup; with several, only the smallest candidate list is
+        scanned.
+        """
+        candidates = []
+        if pos:
+            candidates.append(self.by_pos_prefix.get(pos, []))
+        if level is not None:
+            candidates.append(self.by_level.get(level, []))
+        if aspect is not None:
+            candidates.append(self.by_aspect.get(aspect.lower(), []))
+
+        if not candidates:
+            return list(self.words)
+
+        smallest = min(candidates, key=len)
+        if len(candidates) == 1:
+            return list(smallest)
+
+        return [
+            word for word in smallest
+            if (not pos or pos_matches(word.get('pos', ''), pos)) and
+            (level is None or word.get('level', '') == level) and
+            (aspect is None or word.get('aspect', '').lower() == aspect.lower())
+        ]
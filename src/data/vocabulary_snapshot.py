@@ -0,0 +1,128 @@
+"""
+Precompiled vocabulary snapshots
+
+The word lists parsed from the vocabulary CSV files are stored in a
+compact marshal file under data/.vocab_cache, keyed by the SHA-1 of the
+CSV contents. Extractors load the snapshot instead of re-parsing the CSV
+and rebuild it transparently when the CSV changes.
+
+Snapshots also record how many bytes of the CSV they cover and a
+fingerprint of its header line, so a file that has only been appended to
+can be brought up to date by parsing just the new tail.
+
+Build the snapshots ahead of time (run from src/):
+    python -m data.vocabulary_snapshot
+"""
+import hashlib
+import marshal
+import os
+from typing import Dict, List, Optional
+from data.vocabulary_entry import VocabEntry
+
+SNAPSHOT_DIR = os.path.join(os.path.dirname(__file__), '.vocab_cache')
+
+# Bump when the stored layout changes; older snapshots are then rebuilt
+FORMAT_VERSION = 2
+
+# Word fields in the order they are packed into each row
+FIELDS = VocabEntry.__slots__
+
+
+def content_hash(csv_file: str, length: Optional[int] = None) -> str:
+    """SHA-1 of the file contents, or of just its first length bytes"""
+    digest = hashlib.sha1()
+    remaining = length
+    with open(csv_file, 'rb') as f:
+        while remaining is None or remaining > 0:
+            block = f.read(1 << 20 if remaining is None else min(1 << 20, remaining))
+            if not block:
+                break
+            digest.update(block)
+            if remaining is not None:
+                remaining -= len(block)
+    return digest.hexdigest()
+
+
+def header_fingerprint(header: bytes) -> str:
+    """SHA-1 of a CSV header line"""
+    return hashlib.sha1(header).hexdigest()
+
+
+def snapshot_path(csv_file: str) -> str:
+    """Location of the snapshot for a CSV file"""
+    return os.path.join(SNAPSHOT_DIR, os.path.basename(csv_file) + '.snapshot')
+
+
+def read_snapshot(csv_file: str) -> Optional[Dict]:
+    """
+    The stored snapshot for a CSV file whatever its contents, or None
+
+    Keys: hash (SHA-1 of the first offset bytes of the CSV, or of all of it
+    when offset is None), offset, header (header_fingerprint or None), rows.
+    """
+    try:
+        with open(snapshot_path(csv_file), 'rb') as f:
+            snapshot = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if not isinstance(snapshot, dict) or snapshot.get('version') != FORMAT_VERSION:
+        return None
+    return snapshot
+
+
+def snapshot_words(snapshot: Dict) -> List[VocabEntry]:
+    """Word list stored in a snapshot"""
+    # Rows are stored in VocabEntry field order, None for missing fields
+    return [VocabEntry(*row) for row in snapshot['rows']]
+
+
+def load_snapshot(csv_file: str, digest: str) -> Optional[List[VocabEntry]]:
+    """Load the word list for a CSV file, or None if there is no matching snapshot"""
+    snapshot = read_snapshot(csv_file)
+    if snapshot is None or snapshot.get('hash') != digest:
+        return None
+    return snapshot_words(snapshot)
+
+
+def save_snapshot(csv_file: str, digest: str, words: List[VocabEntry],
+                  offset: Optional[int] = None, header: Optional[str] = None):
+    """Write the word list for a CSV file; failures only cost a re-parse next time"""
+    snapshot = {
+        'version': FORMAT_VERSION,
+        'hash': digest,
+        'offset': offset,
+        'header': header,
+        'rows': [tuple(word.get(field) for field in FIELDS) for word in words]
+    }
+
+    path = snapshot_path(csv_file)
+    temp_path = path + '.tmp'
+    try:
+        os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+        with open(temp_path, 'wb') as f:
+            marshal.dump(snapshot, f)
+        os.replace(temp_path, path)
+    except OSError as e:
+        print(f"⚠️  Warning: Could not write vocabulary snapshot: {e}")
+
+
+def main():
+    """Rebuild the snapshots for the bundled vocabulary files"""
+    from data.vocabulary_extractor import VocabularyExtractor
+    from data.russian_norwegian_extractor import RussianNorwegianExtractor
+
+    for extractor in (VocabularyExtractor(), RussianNorwegianExtractor()):
+        if not os.path.exists(extractor.csv_file):
+            print(f"❌ CSV file not found: {extractor.csv_file}")
+            continue
+
+        words = extractor.rebuild_snapshot()
+        if words is None:
+            continue
+        print(f"✅ {os.path.basename(extractor.csv_file)}: {len(words)} words -> "
+              f"{snapshot_path(extractor.csv_file)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+import csv
+import os
+from typing import Iterator, List, Optional
+from data.load_report import LoadReport
+from data.vocabulary_entry import VocabEntry
+from data.vocabulary_index import VocabularyIndex
+
+
+class VocabularySource:
+    """
+    Cached, indexed word list read from one vocabulary CSV
+
+    Subclasses parse their own CSV layout: _load_words() returns the words
+    of a full load (snapshot, appended rows or parse) and _iter_csv()
+    streams rows for iter_words(). The words are kept until the file's
+    modification time or size changes, with a POS/level/aspect index over
+    them that query() answers from.
+    """
+
+    # Field delimiter of the CSV
+    DELIMITER = ','
+
+    def __init__(self, csv_file: str, quiet: bool = False):
+        self.csv_file = os.path.join(os.path.dirname(__file__), csv_file)
+        # Quiet sources never print; callers read last_report instead
+        self.quiet = quiet
+        self.last_report: Optional[LoadReport] = None
+        # Parsed words, reused until the CSV's mtime or size changes
+        self._words = None
+        self._cache_key = None
+        # POS/level/aspect lookups over _words, rebuilt whenever it is reloaded
+        self._index = None
+
+    def check_csv_file(self) -> bool:
+        """Check if CSV file exists and is readable (only failures are printed)"""
+        if not os.path.exists(self.csv_file):
+            self._print(f"\n❌ CSV file not found: {self.csv_file}")
+            return False
+
+        try:
+            with open(self.csv_file, 'r', encoding='utf-8') as f:
+                reader = csv.reader(f, delimiter=self.DELIMITER)
+                # Try to read the header and first row
+                next(reader)
+                next(reader)
+            return True
+        except Exception as e:
+            self._print(f"❌ Error reading CSV: {e}")
+            return False
+
+    def _print(self, message: str):
+        """Print unless the source is quiet"""
+        if not self.quiet:
+            print(message)
+
+    def _print_missing(self):
+        """Tell the user the CSV is missing"""
+        self._print(f"\n❌ Error: Could not find CSV file at: {self.csv_file}")
+
+    def extract_unique_words(self) -> List[VocabEntry]:
+        """
+        Every word of the CSV, as a copy of the cached list
+
+        The CSV is parsed once per source; later calls reuse the result
+        until the file's modification time or size changes. Parsed words are
+        also kept in a binary snapshot keyed by the CSV's content hash.
+        """
+        if not self._ensure_loaded():
+            return []
+        return list(self._words)
+
+    def _ensure_loaded(self) -> bool:
+        """
+        (Re)load the words and their index if the CSV changed; False if
+        unavailable. Each actual load replaces last_report.
+        """
+        if not os.path.exists(self.csv_file):
+            report = LoadReport(self.csv_file)
+            report.error = "CSV file not found"
+            self.last_report = report
+            self._print_missing()
+            return False
+
+        stat = os.stat(self.csv_file)
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        if self._words is not None and self._cache_key == cache_key:
+            return True
+
+        report = LoadReport(self.csv_file)
+        words = self._load_words(report)
+        self.last_report = report
+        if words is None:
+            return False
+
+        report.words = len(words)
+        if report.parsed:
+            self._print("\n" + report.summary())
+        self._words = words
+        self._index = VocabularyIndex(words)
+        self._cache_key = cache_key
+        return True
+
+    def _load_words(self, report: LoadReport) -> Optional[List[VocabEntry]]:
+        """Words of a full load, or None if the CSV cannot be read; details go into report"""
+        raise NotImplementedError
+
+    def loaded_words(self) -> Optional[List[VocabEntry]]:
+        """
+        The cached word list itself rather than a copy, reloaded first if the
+        CSV changed; None if unavailable. The same list object is returned
+        until the next reload, so callers can tell a reload by identity.
+        Callers must not modify it.
+        """
+        if not self._ensure_loaded():
+            return None
+        return self._words
+
+    def load(self) -> LoadReport:
+        """Load the words if needed and report what that took"""
+        previous = self.last_report
+        self._ensure_loaded()
+        if self.last_report is not previous:
+            return self.last_report
+
+        report = LoadReport(self.csv_file, cache='memory')
+        report.words = len(self._words or [])
+        return report
+
+    def query(self, pos: Optional[str] = None, level: Optional[str] = None,
+              aspect: Optional[str] = None) -> List[VocabEntry]:
+        """
+        Get words matching all given filters: POS tag prefix, CEFR level and
+        verb aspect. Filters are answered from indexes built at load time.
+        """
+        if not self._ensure_loaded():
+            return []
+        return self._index.query(pos=pos, level=level, aspect=aspect)
+
+    def iter_words(self, pos: Optional[str] = None, level: Optional[str] = None,
+                   aspect: Optional[str] = None) -> Iterator[VocabEntry]:
+        """
+        Stream words straight from the CSV, one row at a time
+
+        Takes the same filters as query(), applied inside the row loop, so
+        memory stays flat however large the CSV is.
+        """
+        if not os.path.exists(self.csv_file):
+            self._print_missing()
+            return
+
+        try:
+            yield from self._iter_csv(pos=pos, level=level, aspect=aspect)
+        except Exception as e:
+            self._print(f"\n❌ Error reading CSV file: {e}")
+
+    def _iter_csv(self, report: Optional[LoadReport] = None, pos: Optional[str] = None,
+                  level: Optional[str] = None, aspect: Optional[str] = None) -> Iterator[VocabEntry]:
+        """Words of the CSV that pass the filters, in file order"""
+        raise NotImplementedError
+
+    def get_verbs(self) -> List[VocabEntry]:
+        """Get all verbs with aspect information"""
+        return self.query(pos='V')
+
+    def get_verbs_by_aspect(self, aspect: str) -> List[VocabEntry]:
+        """Get verbs filtered by aspect (perfective/imperfective)"""
+        return self.query(pos='V', aspect=aspect)
@@ -1,39 +1,125 @@
-import json
+import atexit
 import os
+import time
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+import heapq
 import random
+from data.practice_storage import JsonStorage, SqliteStorage
+from data import practice_scoring
+
+# Stats file layout revision, stored as data['schema_version']
+# 1: ISO timestamp strings, fields added over time may be missing
+# 2: integer epoch seconds for every timestamp, every word field present
+SCHEMA_VERSION = 2
+
+def to_epoch(value) -> Optional[int]:
+    """Convert a stored timestamp (epoch seconds or legacy ISO string) to epoch seconds"""
+    if value is None or isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value)
+    try:
+        return int(datetime.fromisoformat(value).timestamp())
+    except (ValueError, TypeError):
+        return None
 
 class WordPracticeDatabase:
     """Database for tracking word practice statistics and performance"""
     
-    def __init__(self, db_file: str = None):
+    def __init__(self, db_file: str = None, backend: str = 'json', compact_every: int = 500,
+                 buffered: bool = False, flush_every: int = 50, flush_interval: float = 30.0):
+        """
+        backend selects the storage engine:
+        - 'json': word_practice_data.json plus an append-only journal
+        - 'sqlite': word_practice_data.db with indexed tables
+        
+        With buffered=True changes are kept in memory and written together
+        after flush_every changes, after flush_interval seconds, at
+        end_session or at interpreter exit.
+        """
+        current_dir = os.path.dirname(os.path.abspath(__file__))
         if db_file is None:
             # Default to data directory
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            db_file = os.path.join(current_dir, 'word_practice_data.json')
+            extension = '.db' if backend == 'sqlite' else '.json'
+            db_file = os.path.join(current_dir, 'word_practice_data' + extension)
         
         self.db_file = db_file
+        self.backend = backend
+        self.buffered = buffered
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._pending_events = []
+        self._last_flush = time.monotonic()
+        if backend == 'sqlite':
+            self.storage = SqliteStorage(db_file)
+        elif backend == 'json':
+            self.storage = JsonStorage(db_file, compact_every=compact_every)
+        else:
+            raise ValueError(f"Unknown storage backend: {backend}")
+        
+        self._review_index = {}
+        self._due_heap = []
+        self._aggregates = self._empty_aggregates()
         self.data = self._load_data()
+        
+        # Carry existing JSON statistics over when switching to SQLite
+        if backend == 'sqlite' and not self.storage.exists():
+            legacy = JsonStorage(os.path.splitext(db_file)[0] + '.json')
+            if legacy.exists():
+                self.data = self._load_data(legacy)
+                self.data.pop('journal_seq', None)
+                self.storage.save(self.data)
+        
+        self._rebuild_review_index()
+        self._rebuild_aggregates()
+        # Levels decay while the app is closed, so bring them up to date
+        self.recompute_mastery_levels()
+        
+        if buffered:
+            atexit.register(self.flush)
     
-    def _load_data(self) -> Dict:
-        """Load data from JSON file or create new structure"""
-        if os.path.exists(self.db_file):
-            try:
-                with open(self.db_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # Migrate old data to new format
-                    self._migrate_data(data)
-                    return data
-            except json.JSONDecodeError:
-                print(f"⚠️  Warning: Could not read {self.db_file}, creating new database")
-                return self._create_empty_db()
-        else:
-            return self._create_empty_db()
+    def _load_data(self, storage=None) -> Dict:
+        """Load data from the storage engine or create new structure"""
+        storage = storage or self.storage
+        data = storage.load()
+        if data is None:
+            data = self._create_empty_db()
+        
+        # A current file is used as is; older ones go through the upgrade steps
+        upgraded = data.get('schema_version', 1) < SCHEMA_VERSION
+        if upgraded:
+            self._migrate_data(data)
+        
+        # Replay changes the engine has not folded into its snapshot yet
+        self.data = data
+        for event in storage.pending_events(data):
+            if upgraded:
+                self._upgrade_event(event)
+            self._apply_event(event)
+        
+        # Write the upgraded layout back so the conversion only happens once
+        if upgraded:
+            storage.save(data)
+        return data
     
     def _migrate_data(self, data: Dict):
-        """Migrate old data format to include new fields"""
-        for word_key, word_data in data.get('words', {}).items():
+        """
+        Bring an older stats file up to SCHEMA_VERSION
+        
+        Each step runs once per file: the upgraded file is written back with
+        the new schema_version, and later loads skip this method entirely.
+        """
+        version = data.get('schema_version', 1)
+        if version < 2:
+            self._upgrade_to_v2(data)
+        data['schema_version'] = SCHEMA_VERSION
+    
+    def _upgrade_to_v2(self, data: Dict):
+        """Fill in fields missing from old records and store epoch timestamps"""
+        data.setdefault('words', {})
+        data.setdefault('sessions', [])
+        for word_key, word_data in data['words'].items():
             # Add missing fields for new mastery calculation
             if 'mastery_level' not in word_data:
                 word_data['mastery_level'] = 0
@@ -45,26 +131,70 @@ class WordPracticeDatabase:
                 word_data['attempts_history'] = []
             if 'first_seen' not in word_data:
                 # Use last_practiced as fallback, or current time if not available
-                word_data['first_seen'] = word_data.get('last_practiced', datetime.now().isoformat())
+                word_data['first_seen'] = word_data.get('last_practiced', int(time.time()))
             
             # Ensure 'russian' field exists (for backward compatibility)
             if 'russian' not in word_data:
                 word_data['russian'] = word_key
+            
+            # ISO strings -> epoch seconds; ISO is only rendered for display now
+            word_data['first_seen'] = to_epoch(word_data['first_seen'])
+            word_data['last_practiced'] = to_epoch(word_data['last_practiced'])
+            for attempt in word_data['attempts_history']:
+                attempt['date'] = to_epoch(attempt['date'])
+        
+        for session in data['sessions']:
+            session['start_time'] = to_epoch(session['start_time'])
+            session['end_time'] = to_epoch(session['end_time'])
+    
+    def _upgrade_event(self, event: Dict):
+        """Convert a journal event written alongside an older stats file"""
+        if 'time' in event:
+            event['time'] = to_epoch(event['time'])
 
     def _create_empty_db(self) -> Dict:
         """Create empty database structure"""
         return {
+            'schema_version': SCHEMA_VERSION,
             'words': {},  # word -> {attempts, correct, incorrect, streak, last_practiced, mastery_level}
             'sessions': []  # list of session records
         }
     
-    def _save_data(self):
-        """Save data to JSON file"""
-        os.makedirs(os.path.dirname(self.db_file), exist_ok=True)
-        with open(self.db_file, 'w', encoding='utf-8') as f:
-            json.dump(self.data, f, ensure_ascii=False, indent=2)
+    def _log_event(self, event: Dict):
+        """Hand a single change to the storage engine, or buffer it"""
+        if not self.buffered:
+            self.storage.append(event, self.data)
+            return
+        
+        self._pending_events.append(event)
+        if (len(self._pending_events) >= self.flush_every or
+                time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+    
+    def flush(self):
+        """Write buffered changes to the storage engine in one go"""
+        if self._pending_events:
+            self.storage.flush(self._pending_events, self.data)
+            self._pending_events = []
+        self._last_flush = time.monotonic()
+    
+    def compact(self):
+        """Let the storage engine fold its incremental writes into a snapshot"""
+        self.storage.compact(self.data)
     
-    def _calculate_mastery_level(self, stats: Dict) -> int:
+    def _apply_event(self, event: Dict):
+        """Apply a journal event to the in-memory data"""
+        op = event['op']
+        if op == 'attempt':
+            self._apply_attempt(event)
+        elif op == 'start_session':
+            self._apply_start_session(event)
+        elif op == 'session_word':
+            self._apply_session_word(event)
+        elif op == 'end_session':
+            self._apply_end_session(event)
+    
+    def _calculate_mastery_level(self, stats: Dict, now: float = None) -> int:
         """
         Calculate mastery level (0-5) using multiple factors
         
@@ -75,8 +205,13 @@ class WordPracticeDatabase:
         Level 3: 60-80% accuracy, showing progress
         Level 4: 80-90% accuracy, nearly mastered
         Level 5: 90%+ accuracy with retention over time
+        
+        `now` (epoch seconds) defaults to the current time; journal replay
+        passes the attempt's own timestamp so replayed levels match the
+        recorded ones.
         """
-        from datetime import datetime, timedelta
+        if now is None:
+            now = time.time()
         
         total_attempts = stats.get('total_attempts', 0)
         correct = stats.get('correct', 0)
@@ -139,26 +274,22 @@ class WordPracticeDatabase:
         
         # Factor 4: Recency penalty (time decay)
         recency_modifier = 1.0
-        if last_practiced:
-            try:
-                last_date = datetime.fromisoformat(last_practiced)
-                days_since = (datetime.now() - last_date).days
-                
-                # Apply decay based on how long ago
-                if days_since <= 1:
-                    recency_modifier = 1.0  # Very recent
-                elif days_since <= 3:
-                    recency_modifier = 0.95  # Recent
-                elif days_since <= 7:
-                    recency_modifier = 0.9  # Within a week
-                elif days_since <= 14:
-                    recency_modifier = 0.8  # Two weeks
-                elif days_since <= 30:
-                    recency_modifier = 0.7  # A month
-                else:
-                    recency_modifier = 0.6  # Very old, might be forgotten
-            except (ValueError, TypeError):
-                recency_modifier = 0.8  # Unknown date, slight penalty
+        if last_practiced is not None:
+            days_since = (now - last_practiced) // 86400
+            
+            # Apply decay based on how long ago
+            if days_since <= 1:
+                recency_modifier = 1.0  # Very recent
+            elif days_since <= 3:
+                recency_modifier = 0.95  # Recent
+            elif days_since <= 7:
+                recency_modifier = 0.9  # Within a week
+            elif days_since <= 14:
+                recency_modifier = 0.8  # Two weeks
+            elif days_since <= 30:
+                recency_modifier = 0.7  # A month
+            else:
+                recency_modifier = 0.6  # Very old, might be forgotten
         
         # Calculate final mastery score
         mastery_score = (accuracy_points + consistency_bonus) * experience_modifier * recency_modifier
@@ -179,34 +310,45 @@ class WordPracticeDatabase:
 
     def record_attempt(self, russian: str, translation: str, user_answer: str, is_correct: bool):
         """Record a practice attempt and update statistics"""
-        from datetime import datetime
+        event = {
+            'op': 'attempt',
+            'russian': russian,
+            'translation': translation,
+            'user_answer': user_answer,
+            'correct': is_correct,
+            'time': int(time.time())
+        }
+        self._apply_attempt(event)
+        self._log_event(event)
+    
+    def _apply_attempt(self, event: Dict):
+        """Update word statistics for a recorded attempt"""
+        russian = event['russian']
+        is_correct = event['correct']
+        timestamp = event['time']
+        
+        # Take the old record out of the running totals before changing it
+        if russian in self.data['words']:
+            self._update_aggregates(self.data['words'][russian], -1)
         
         # Initialize word if not exists
         if russian not in self.data['words']:
             self.data['words'][russian] = {
                 'russian': russian,
-                'english': translation,  # Keep 'english' for backward compatibility
-                'translation': translation,  # Also store as 'translation'
+                'english': event['translation'],  # Keep 'english' for backward compatibility
+                'translation': event['translation'],  # Also store as 'translation'
                 'total_attempts': 0,
                 'correct': 0,
                 'incorrect': 0,
                 'streak': 0,
                 'mastery_level': 0,
-                'first_seen': datetime.now().isoformat(),
-                'last_practiced': datetime.now().isoformat(),
+                'first_seen': timestamp,
+                'last_practiced': timestamp,
                 'attempts_history': []
             }
         
         word_data = self.data['words'][russian]
         
-        # Ensure all required fields exist (for backward compatibility)
-        if 'attempts_history' not in word_data:
-            word_data['attempts_history'] = []
-        if 'first_seen' not in word_data:
-            word_data['first_seen'] = word_data.get('last_practiced', datetime.now().isoformat())
-        if 'russian' not in word_data:
-            word_data['russian'] = russian
-        
         # Update counts
         word_data['total_attempts'] += 1
         if is_correct:
@@ -217,57 +359,21 @@ class WordPracticeDatabase:
             word_data['streak'] = min(0, word_data['streak']) - 1
         
         # Update timestamps
-        word_data['last_practiced'] = datetime.now().isoformat()
+        word_data['last_practiced'] = timestamp
         
         # Store attempt in history (keep last 20 attempts)
         word_data['attempts_history'].append({
-            'date': datetime.now().isoformat(),
+            'date': timestamp,
             'correct': is_correct,
-            'user_answer': user_answer
+            'user_answer': event['user_answer']
         })
         if len(word_data['attempts_history']) > 20:
             word_data['attempts_history'] = word_data['attempts_history'][-20:]
         
         # Recalculate mastery level using new algorithm
-        word_data['mastery_level'] = self._calculate_mastery_level(word_data)
-        
-        # Save to file
-        self._save_data()
-
-    def get_statistics(self) -> Dict:
-        """Get comprehensive practice statistics"""
-        total_words = len(self.data['words'])
-        total_attempts = sum(w['total_attempts'] for w in self.data['words'].values())
-        total_correct = sum(w['correct'] for w in self.data['words'].values())
-        total_incorrect = sum(w['incorrect'] for w in self.data['words'].values())
-        
-        # Count mastered words (level 4-5 with high accuracy)
-        mastered_words = sum(
-            1 for w in self.data['words'].values()
-            if w['mastery_level'] >= 4 and 
-            (w['correct'] / w['total_attempts'] * 100 >= 80 if w['total_attempts'] > 0 else False)
-        )
-        
-        # Count words needing review (level 0-2 or accuracy < 60%)
-        needs_review = sum(
-            1 for w in self.data['words'].values()
-            if w['mastery_level'] <= 2 or
-            (w['correct'] / w['total_attempts'] * 100 < 60 if w['total_attempts'] > 0 else True)
-        )
-        
-        # Calculate overall accuracy
-        accuracy = (total_correct / total_attempts * 100) if total_attempts > 0 else 0
-        
-        return {
-            'total_words_practiced': total_words,
-            'total_attempts': total_attempts,
-            'total_correct': total_correct,
-            'total_incorrect': total_incorrect,
-            'accuracy': accuracy,
-            'mastered_words': mastered_words,
-            'needs_review': needs_review,
-            'total_sessions': len(self.data['sessions'])
-        }
+        word_data['mastery_level'] = self._calculate_mastery_level(word_data, now=timestamp)
+        self._index_word(russian)
+        self._update_aggregates(word_data, 1)
     
     def get_word_stats(self, russian_word: str) -> Dict:
         """Get statistics for a specific word"""
@@ -281,17 +387,27 @@ class WordPracticeDatabase:
                 'mastery_level': 0
             }
         
-        # Ensure all required fields exist
         word_data = self.data['words'][russian_word]
         return {
-            'total_attempts': word_data.get('total_attempts', 0),
-            'correct': word_data.get('correct', 0),
-            'incorrect': word_data.get('incorrect', 0),
-            'streak': word_data.get('streak', 0),
-            'last_practiced': word_data.get('last_practiced'),
-            'mastery_level': word_data.get('mastery_level', 0)
+            'total_attempts': word_data['total_attempts'],
+            'correct': word_data['correct'],
+            'incorrect': word_data['incorrect'],
+            'streak': word_data['streak'],
+            'last_practiced': word_data['last_practiced'],
+            'mastery_level': word_data['mastery_level']
         }
     
+    # Optimal review intervals based on mastery level (in hours)
+    # Lower mastery = shorter intervals
+    REVIEW_INTERVALS = {
+        0: 4,      # Review after 4 hours
+        1: 12,     # Review after 12 hours
+        2: 24,     # Review after 1 day
+        3: 72,     # Review after 3 days
+        4: 168,    # Review after 1 week
+        5: 336     # Review after 2 weeks
+    }
+    
     def _calculate_word_priority(self, word_stats: Dict) -> float:
         """
         Calculate priority score for a word (higher = more important to practice)
@@ -307,6 +423,18 @@ class WordPracticeDatabase:
         if word_stats['total_attempts'] == 0:
             return 100  # Never seen - highest priority
         
+        priority = self._base_priority(word_stats)
+        
+        # Spaced repetition: time since last practice based on mastery level
+        if word_stats['last_practiced'] is not None:
+            hours_ago = (time.time() - word_stats['last_practiced']) / 3600
+            optimal = self.REVIEW_INTERVALS.get(word_stats['mastery_level'], 24)
+            priority += self._timing_priority(hours_ago, optimal)
+        
+        return max(0, priority)
+    
+    def _base_priority(self, word_stats: Dict) -> float:
+        """Part of the priority that only changes when the word is practiced"""
         priority = 50  # Base priority
         
         # Accuracy factor (0-100%)
@@ -328,35 +456,146 @@ class WordPracticeDatabase:
         if word_stats['streak'] == 0 and word_stats['total_attempts'] > 0:
             priority += 30  # Just made a mistake
         
-        # Spaced repetition: time since last practice based on mastery level
-        if word_stats['last_practiced']:
-            last_practice = datetime.fromisoformat(word_stats['last_practiced'])
-            hours_ago = (datetime.now() - last_practice).total_seconds() / 3600
-            
-            # Optimal review intervals based on mastery level (in hours)
-            # Lower mastery = shorter intervals
-            optimal_intervals = {
-                0: 4,      # Review after 4 hours
-                1: 12,     # Review after 12 hours
-                2: 24,     # Review after 1 day
-                3: 72,     # Review after 3 days
-                4: 168,    # Review after 1 week
-                5: 336     # Review after 2 weeks
-            }
+        return priority
+    
+    def _timing_priority(self, hours_ago: float, optimal: float) -> float:
+        """Spaced repetition adjustment: how overdue the word is"""
+        if hours_ago >= optimal * 1.2:  # 20% past optimal time
+            return 25
+        elif hours_ago >= optimal:
+            return 15
+        elif hours_ago >= optimal * 0.8:  # Within 80% of optimal
+            return 5
+        elif hours_ago < optimal * 0.3:  # Too recent
+            return -30
+        return 0
+    
+    def _rebuild_review_index(self):
+        """Build the review index for every practiced word"""
+        practiced = [(russian, word_data) for russian, word_data in self.data['words'].items()
+                     if word_data['total_attempts'] > 0]
+        
+        if practice_scoring.HAVE_NUMPY and len(practiced) >= practice_scoring.BATCH_THRESHOLD:
+            columns = practice_scoring.pack_word_stats([word_data for _, word_data in practiced])
+            base_priorities = practice_scoring.batch_base_priorities(columns).tolist()
+            last_epochs = [None if epoch != epoch else epoch  # NaN check
+                           for epoch in columns['last_practiced'].tolist()]
+        else:
+            base_priorities = [self._base_priority(word_data) for _, word_data in practiced]
+            last_epochs = [word_data['last_practiced'] for _, word_data in practiced]
+        
+        self._review_index = {
+            russian: (base, last_epoch, self.REVIEW_INTERVALS.get(word_data['mastery_level'], 24))
+            for (russian, word_data), base, last_epoch in zip(practiced, base_priorities, last_epochs)
+        }
+        self._due_heap = [(self._due_epoch(entry), russian) for russian, entry in self._review_index.items()]
+        heapq.heapify(self._due_heap)
+    
+    def _index_word(self, russian: str):
+        """
+        Store the parse-free parts of a word's priority and push its due time
+        
+        Index entries are (base_priority, last_practiced_epoch, interval_hours),
+        so ranking a word later costs a subtraction instead of an ISO parse.
+        """
+        word_data = self.data['words'][russian]
+        if word_data['total_attempts'] == 0:
+            self._review_index.pop(russian, None)
+            return
+        
+        interval = self.REVIEW_INTERVALS.get(word_data['mastery_level'], 24)
+        entry = (self._base_priority(word_data), word_data['last_practiced'], interval)
+        self._review_index[russian] = entry
+        heapq.heappush(self._due_heap, (self._due_epoch(entry), russian))
+        
+        # Drop superseded heap entries once they outnumber the live ones
+        if len(self._due_heap) > 2 * len(self._review_index) + 64:
+            self._due_heap = [(self._due_epoch(e), word) for word, e in self._review_index.items()]
+            heapq.heapify(self._due_heap)
+    
+    def _due_epoch(self, entry: tuple) -> float:
+        """Epoch time at which an indexed word is due for review"""
+        _, last_epoch, interval = entry
+        return last_epoch + interval * 3600 if last_epoch is not None else 0
+    
+    def _indexed_priority(self, russian: str, now_epoch: float) -> float:
+        """Priority of a practiced word computed from its index entry"""
+        base, last_epoch, interval = self._review_index[russian]
+        if last_epoch is None:
+            return max(0, base)
+        hours_ago = (now_epoch - last_epoch) / 3600
+        return max(0, base + self._timing_priority(hours_ago, interval))
+    
+    def _rank_review_batch(self, review: List[Dict], limit: int, now_epoch: float) -> List[Dict]:
+        """Rank review candidates in one vectorized pass (NumPy)"""
+        np = practice_scoring.np
+        entries = [self._review_index[word['russian']] for word in review]
+        scores = practice_scoring.batch_priorities(
+            np.fromiter((e[0] for e in entries), dtype=np.float64, count=len(entries)),
+            np.fromiter((np.nan if e[1] is None else e[1] for e in entries), dtype=np.float64, count=len(entries)),
+            np.fromiter((e[2] for e in entries), dtype=np.float64, count=len(entries)),
+            now_epoch
+        )
+        # Stable sort keeps ties in pool order, like heapq.nlargest
+        order = np.argsort(-scores, kind='stable')[:limit]
+        return [review[i] for i in order]
+    
+    def recompute_mastery_levels(self) -> int:
+        """
+        Re-apply mastery decay to every word as of now and return how many
+        levels changed. Uses the NumPy batch path for large vocabularies.
+        """
+        words = list(self.data['words'].values())
+        if practice_scoring.HAVE_NUMPY and len(words) >= practice_scoring.BATCH_THRESHOLD:
+            columns = practice_scoring.pack_word_stats(words)
+            levels = practice_scoring.batch_mastery_levels(columns, time.time()).tolist()
+        else:
+            levels = [self._calculate_mastery_level(word_data) for word_data in words]
+        
+        changed = 0
+        for word_data, level in zip(words, levels):
+            if word_data['mastery_level'] != level:
+                self._update_aggregates(word_data, -1)
+                word_data['mastery_level'] = level
+                self._update_aggregates(word_data, 1)
+                self._index_word(word_data['russian'])
+                changed += 1
+        
+        if changed:
+            self.storage.save(self.data)
+        return changed
+    
+    def get_due_words(self, limit: int = None) -> List[str]:
+        """
+        Words whose review interval has passed, most overdue first
+        
+        Walks the due heap from its root without popping, so only the
+        due entries (plus their direct children) are ever visited. A word
+        re-pushed with an unchanged due time has several live-looking
+        entries; only the first is taken.
+        """
+        now_epoch = time.time()
+        heap = self._due_heap
+        frontier = [(heap[0], 0)] if heap else []
+        due_words = []
+        seen = set()
+        
+        while frontier and (limit is None or len(due_words) < limit):
+            (due, russian), position = heapq.heappop(frontier)
+            if due > now_epoch:
+                break
             
-            optimal = optimal_intervals.get(mastery, 24)
+            entry = self._review_index.get(russian)
+            # Skip entries superseded by a later attempt
+            if entry is not None and russian not in seen and self._due_epoch(entry) == due:
+                seen.add(russian)
+                due_words.append(russian)
             
-            # Calculate how overdue this word is
-            if hours_ago >= optimal * 1.2:  # 20% past optimal time
-                priority += 25
-            elif hours_ago >= optimal:
-                priority += 15
-            elif hours_ago >= optimal * 0.8:  # Within 80% of optimal
-                priority += 5
-            elif hours_ago < optimal * 0.3:  # Too recent
-                priority -= 30
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
         
-        return max(0, priority)
+        return due_words
     
     def get_words_for_practice(self, available_words: List[Dict], num_words: int = 30) -> List[Dict]:
         """
@@ -364,47 +603,43 @@ class WordPracticeDatabase:
         - ~50% new words
         - ~50% review (mistakes, low mastery, spaced repetition)
         """
-        # Calculate priority for each word
-        word_priorities = []
-        for word in available_words:
-            russian = word['russian']
-            stats = self.get_word_stats(russian)
-            priority = self._calculate_word_priority(stats)
-            word_priorities.append({
-                'word': word,
-                'priority': priority,
-                'stats': stats
-            })
-        
-        # Sort by priority (highest first)
-        word_priorities.sort(key=lambda x: x['priority'], reverse=True)
+        now_epoch = time.time()
         
-        # Categorize words
-        never_seen = [wp for wp in word_priorities if wp['stats']['total_attempts'] == 0]
-        
-        # Review words: mistakes, low mastery, or due for spaced repetition
-        review = [wp for wp in word_priorities if wp['stats']['total_attempts'] > 0]
+        # Never seen words all share the top priority, so keep their order
+        never_seen = []
+        review = []
+        for word in available_words:
+            if word['russian'] in self._review_index:
+                review.append(word)
+            else:
+                never_seen.append(word)
         
         # Calculate targets: 50% new, 50% review
         target_new = int(num_words * 0.5)
         target_review = num_words - target_new
-        
-        practice_list = []
-        
-        # Add new words (up to 50%)
         new_to_add = min(len(never_seen), target_new)
-        practice_list.extend([wp['word'] for wp in never_seen[:new_to_add]])
         
-        # Add review words (mistakes, low mastery, spaced repetition)
-        review_to_add = min(len(review), target_review)
-        practice_list.extend([wp['word'] for wp in review[:review_to_add]])
+        # Top-k selection instead of sorting every review candidate
+        # (review words also fill slots left over when new words run out)
+        if practice_scoring.HAVE_NUMPY and len(review) >= practice_scoring.BATCH_THRESHOLD:
+            review_top = self._rank_review_batch(review, num_words - new_to_add, now_epoch)
+        else:
+            review_top = heapq.nlargest(
+                num_words - new_to_add,
+                review,
+                key=lambda w: self._indexed_priority(w['russian'], now_epoch)
+            )
+        review_to_add = min(len(review_top), target_review)
+        
+        practice_list = never_seen[:new_to_add] + review_top[:review_to_add]
         
-        # Fill any remaining slots with highest priority words
+        # Fill any remaining slots from whichever group still has words
         remaining = num_words - len(practice_list)
         if remaining > 0:
-            remaining_pool = never_seen[new_to_add:] + review[review_to_add:]
-            remaining_pool.sort(key=lambda x: x['priority'], reverse=True)
-            practice_list.extend([wp['word'] for wp in remaining_pool[:remaining]])
+            if review_to_add < len(review_top):
+                practice_list.extend(review_top[review_to_add:review_to_add + remaining])
+            else:
+                practice_list.extend(never_seen[new_to_add:new_to_add + remaining])
         
         # Final shuffle to mix new and review words
         random.shuffle(practice_list)
@@ -414,88 +649,134 @@ class WordPracticeDatabase:
     def start_session(self) -> int:
         """Start a new practice session and return session ID"""
         session_id = len(self.data['sessions'])
-        session = {
+        event = {
+            'op': 'start_session',
             'id': session_id,
-            'start_time': datetime.now().isoformat(),
+            'time': int(time.time())
+        }
+        self._apply_start_session(event)
+        self._log_event(event)
+        return session_id
+    
+    def _apply_start_session(self, event: Dict):
+        """Append a new session record"""
+        session = {
+            'id': event['id'],
+            'start_time': event['time'],
             'end_time': None,
             'words_practiced': [],
             'correct_count': 0,
             'incorrect_count': 0
         }
         self.data['sessions'].append(session)
-        self._save_data()
-        return session_id
     
     def add_word_to_session(self, session_id: int, russian_word: str):
         """Add a word to the current session's word list"""
         if session_id < len(self.data['sessions']):
             session = self.data['sessions'][session_id]
             if russian_word not in session['words_practiced']:
-                session['words_practiced'].append(russian_word)
-            self._save_data()
+                event = {
+                    'op': 'session_word',
+                    'id': session_id,
+                    'russian': russian_word
+                }
+                self._apply_session_word(event)
+                self._log_event(event)
+    
+    def _apply_session_word(self, event: Dict):
+        """Add a word to a session's word list"""
+        session = self.data['sessions'][event['id']]
+        if event['russian'] not in session['words_practiced']:
+            session['words_practiced'].append(event['russian'])
     
     def end_session(self, session_id: int, correct_count: int, incorrect_count: int):
         """End a practice session with final counts"""
         if session_id < len(self.data['sessions']):
-            self.data['sessions'][session_id]['end_time'] = datetime.now().isoformat()
-            self.data['sessions'][session_id]['correct_count'] = correct_count
-            self.data['sessions'][session_id]['incorrect_count'] = incorrect_count
-            self._save_data()
+            event = {
+                'op': 'end_session',
+                'id': session_id,
+                'time': int(time.time()),
+                'correct_count': correct_count,
+                'incorrect_count': incorrect_count
+            }
+            self._apply_end_session(event)
+            self._log_event(event)
+            self.flush()
     
-    def get_statistics(self) -> Dict[str, Any]:
-        """Get overall practice statistics"""
+    def _apply_end_session(self, event: Dict):
+        """Store end time and final counts for a session"""
+        session = self.data['sessions'][event['id']]
+        session['end_time'] = event['time']
+        session['correct_count'] = event['correct_count']
+        session['incorrect_count'] = event['incorrect_count']
+    
+    def _empty_aggregates(self) -> Dict:
+        """Running totals behind get_statistics"""
+        return {
+            'total_words_practiced': 0,
+            'total_attempts': 0,
+            'total_correct': 0,
+            'total_incorrect': 0,
+            'mastered_words': 0,
+            'needs_review': 0,
+            'mastery_histogram': [0] * 6  # words per mastery level 0-5
+        }
+    
+    def _rebuild_aggregates(self):
+        """Recount the running totals from every word record"""
+        self._aggregates = self._empty_aggregates()
+        for word_data in self.data['words'].values():
+            self._update_aggregates(word_data, 1)
+    
+    def _update_aggregates(self, word_data: Dict, sign: int):
+        """Add (sign=1) or remove (sign=-1) one word's share of the running totals"""
+        total_attempts = word_data['total_attempts']
         # Only count words that have actually been practiced (attempts > 0)
-        practiced_words = {k: v for k, v in self.data['words'].items() if v.get('total_attempts', 0) > 0}
-        
-        total_words_practiced = len(practiced_words)
-        total_attempts = sum(word['total_attempts'] for word in practiced_words.values())
-        total_correct = sum(word['correct'] for word in practiced_words.values())
-        total_incorrect = sum(word['incorrect'] for word in practiced_words.values())
-        
-        # Count mastered words (mastery level 4-5 AND accuracy > 80%)
-        mastered_words = sum(
-            1 for word in practiced_words.values() 
-            if word.get('mastery_level', 0) >= 4 and 
-            (word['correct'] / word['total_attempts']) > 0.8
-        )
+        if total_attempts == 0:
+            return
         
-        # Words needing review (accuracy < 70% or mastery < 2)
-        needs_review = sum(
-            1 for word in practiced_words.values()
-            if (word['correct'] / word['total_attempts']) < 0.7 or
-            word.get('mastery_level', 0) < 2
-        )
+        aggregates = self._aggregates
+        aggregates['total_words_practiced'] += sign
+        aggregates['total_attempts'] += sign * total_attempts
+        aggregates['total_correct'] += sign * word_data['correct']
+        aggregates['total_incorrect'] += sign * word_data['incorrect']
         
-        # Calculate overall accuracy
-        accuracy = (total_correct / total_attempts * 100) if total_attempts > 0 else 0
+        accuracy = word_data['correct'] / total_attempts
+        mastery = word_data['mastery_level']
+        aggregates['mastery_histogram'][mastery] += sign
         
-        return {
-            'total_words_practiced': total_words_practiced,
-            'total_attempts': total_attempts,
-            'total_correct': total_correct,
-            'total_incorrect': total_incorrect,
-            'accuracy': accuracy,
-            'mastered_words': mastered_words,
-            'needs_review': needs_review,
-            'total_sessions': len(self.data['sessions'])
-        }
+        # Mastered: mastery level 4-5 AND accuracy > 80%
+        if mastery >= 4 and accuracy > 0.8:
+            aggregates['mastered_words'] += sign
+        
+        # Needs review: accuracy < 70% or mastery < 2
+        if accuracy < 0.7 or mastery < 2:
+            aggregates['needs_review'] += sign
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get overall practice statistics"""
+        stats = dict(self._aggregates)
+        stats['mastery_histogram'] = list(self._aggregates['mastery_histogram'])
+        stats['total_sessions'] = len(self.data['sessions'])
+        
+        # Calculate overall accuracy
+        total_attempts = stats['total_attempts']
+        stats['accuracy'] = (stats['total_correct'] / total_attempts * 100) if total_attempts > 0 else 0
+        return stats
     
     def get_session_history(self, limit: int = 10) -> List[Dict]:
         """Get recent session history"""
-        sessions = sorted(
-            self.data['sessions'],
-            key=lambda s: s['start_time'],
-            reverse=True
-        )
-        return sessions[:limit]
+        return self.storage.session_history(self.data, limit)
     
     def reset_statistics(self):
         """Reset all statistics (use with caution!)"""
-        # Delete the old file
-        if os.path.exists(self.db_file):
-            os.remove(self.db_file)
+        # Delete the old files
+        self._pending_events = []
+        self.storage.reset()
         
         # Create fresh database
         self.data = self._create_empty_db()
-        self._save_data()
+        self._rebuild_review_index()
+        self._rebuild_aggregates()
+        self.storage.save(self.data)
         print("\n✅ All statistics have been reset successfully!")
\ No newline at end of file
@@ -1,33 +1,108 @@
+"""
+Rule-based Russian adjective declension
+
+decline_adjective() derives every gender, number and case form from the
+masculine nominative singular. Hard (-ый), stressed (-ой) and soft (-ий)
+stems use the ending tables below; velar and sibilant stems (русский,
+хороший) follow the usual spelling rules. The masculine and plural
+accusatives depend on the animacy of the noun, so both variants are
+available. Paradigms are memoized.
+"""
+from functools import lru_cache
+from typing import Dict, Tuple
+from declension.nouns import CASES, SIBILANTS, VELARS
+
+GENDERS = ('masculine', 'feminine', 'neuter', 'plural')
+
+ADJECTIVE_ENDINGS = ('ый', 'ой', 'ий')
+
+# Hard stem endings per gender; the accusative of masculine and plural is
+# filled in from animacy, and the masculine nominative is the word itself
+HARD_ENDINGS = {
+    'masculine': {'genitive': 'ого', 'dative': 'ому', 'instrumental': 'ым', 'prepositional': 'ом'},
+    'feminine': {'nominative': 'ая', 'accusative': 'ую', 'genitive': 'ой', 'dative': 'ой',
+                 'instrumental': 'ой', 'prepositional': 'ой'},
+    'neuter': {'nominative': 'ое', 'accusative': 'ое', 'genitive': 'ого', 'dative': 'ому',
+               'instrumental': 'ым', 'prepositional': 'ом'},
+    'plural': {'nominative': 'ые', 'genitive': 'ых', 'dative': 'ым', 'instrumental': 'ыми',
+               'prepositional': 'ых'}
+}
+
+SOFT_ENDINGS = {
+    'masculine': {'genitive': 'его', 'dative': 'ему', 'instrumental': 'им', 'prepositional': 'ем'},
+    'feminine': {'nominative': 'яя', 'accusative': 'юю', 'genitive': 'ей', 'dative': 'ей',
+                 'instrumental': 'ей', 'prepositional': 'ей'},
+    'neuter': {'nominative': 'ее', 'accusative': 'ее', 'genitive': 'его', 'dative': 'ему',
+               'instrumental': 'им', 'prepositional': 'ем'},
+    'plural': {'nominative': 'ие', 'genitive': 'их', 'dative': 'им', 'instrumental': 'ими',
+               'prepositional': 'их'}
+}
+
+
+def is_declinable_adjective(word: str) -> bool:
+    """Whether a word has a long-form adjective ending the tables cover"""
+    return len(word) > 2 and ' ' not in word and word.endswith(ADJECTIVE_ENDINGS)
+
+
+def stem_type(nominative: str) -> str:
+    """'hard', 'soft' or 'mixed' (velar/sibilant stem) from the masculine nominative"""
+    last = nominative[-3]
+    if last in VELARS or last in SIBILANTS:
+        return 'mixed'
+    if nominative.endswith('ий'):
+        return 'soft'
+    return 'hard'
+
+
+def _join(stem: str, ending: str, stressed: bool) -> str:
+    """Attach a hard ending with the spelling rules (no ы after velars/sibilants, unstressed о -> е after sibilants)"""
+    last, first = stem[-1], ending[0]
+    if first == 'ы' and (last in VELARS or last in SIBILANTS):
+        ending = 'и' + ending[1:]
+    elif first == 'о' and last in SIBILANTS and not stressed:
+        ending = 'е' + ending[1:]
+    return stem + ending
+
+
+@lru_cache(maxsize=4096)
+def _paradigm(nominative: str, animate: bool) -> Tuple[Tuple[str, Tuple[Tuple[str, str], ...]], ...]:
+    """All forms of one adjective as nested (gender, ((case, form), ...)) pairs; cached, so kept immutable"""
+    stem = nominative[:-2]
+    soft = stem_type(nominative) == 'soft'
+    stressed = nominative.endswith('ой')
+    table = SOFT_ENDINGS if soft else HARD_ENDINGS
+
+    paradigm = []
+    for gender in GENDERS:
+        forms = {case: stem + ending if soft else _join(stem, ending, stressed)
+                 for case, ending in table[gender].items()}
+        if gender == 'masculine':
+            forms['nominative'] = nominative
+        if 'accusative' not in forms:
+            forms['accusative'] = forms['genitive'] if animate else forms['nominative']
+        paradigm.append((gender, tuple((case, forms[case]) for case in CASES)))
+    return tuple(paradigm)
+
+
+def decline_adjective(nominative: str, animate: bool = False) -> Dict[str, Dict[str, str]]:
+    """
+    Every form of an adjective, by gender ('plural' for all genders) and case
+
+    animate selects the accusative used with animate nouns (красивого
+    мальчика, красивых девушек) for the masculine and plural forms.
+    """
+    if not is_declinable_adjective(nominative):
+        raise ValueError(f"Not a long-form adjective: {nominative}")
+    return {gender: dict(forms) for gender, forms in _paradigm(nominative, animate)}
+
+
 def get_adjective_declensions(adjective):
-    declensions = {
-        'красивый': {
-            'nominative': 'красивый',
-            'genitive': 'красивого',
-            'dative': 'красивому',
-            'accusative': 'красивого',
-            'instrumental': 'красивым',
-            'prepositional': 'красивом'
-        },
-        'умный': {
-            'nominative': 'умный',
-            'genitive': 'умного',
-            'dative': 'умному',
-            'accusative': 'умного',
-            'instrumental': 'умным',
-            'prepositional': 'умном'
-        },
-        'смешной': {
-            'nominative': 'смешной',
-            'genitive': 'смешного',
-            'dative': 'смешному',
-            'accusative': 'смешного',
-            'instrumental': 'смешным',
-            'prepositional': 'смешном'
-        },
-        # Add more adjectives and their declensions here
-    }
-    
-    return declensions.get(adjective, "Adjective not found.")
+    """Masculine singular forms of an adjective (animate accusative)"""
+    if not is_declinable_adjective(adjective):
+        return "Adjective not found."
+    masculine = decline_adjective(adjective, animate=True)['masculine']
+    order = ('nominative', 'genitive', 'dative', 'accusative', 'instrumental', 'prepositional')
+    return {case: masculine[case] for case in order}
 
 def display_declensions(adjective):
     declensions = get_adjective_declensions(adjective)
@@ -41,4 +116,4 @@ def display_declensions(adjective):
 if __name__ == "__main__":
     print("Welcome to the Russian Adjective Declension Tutor!")
     user_input = input("Enter an adjective to see its declensions: ")
-    display_declensions(user_input)
\ No newline at end of file
+    display_declensions(user_input)
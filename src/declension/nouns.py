@@ -1,3 +1,363 @@
+"""
+Rule-based Russian noun declension
+
+decline_noun() derives all six cases, singular and plural, from the
+nominative singular plus gender, declension class and animacy. Regular
+nouns follow the ending tables below (with the velar/sibilant spelling
+rules and the fleeting vowel of the genitive plural: масло -> масел,
+окно -> окон); the irregular ones are listed in NOUN_EXCEPTIONS. Paradigms
+are memoized, so a noun is only worked out the first time it is asked for.
+"""
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+CASES = ('nominative', 'accusative', 'genitive', 'dative', 'instrumental', 'prepositional')
+
+VELARS = 'гкх'
+SIBILANTS = 'жшщч'
+VOWELS = 'аеёиоуыэюя'
+
+# Nouns that never change form
+INDECLINABLE = {'метро', 'кафе', 'кофе', 'такси', 'радио', 'кино', 'пальто', 'меню', 'фото', 'шоссе'}
+
+# Masculine nouns with a stressed -а/-я nominative plural (дома, учителя);
+# the other plural cases are regular
+A_PLURALS = {
+    'дом', 'город', 'снег', 'паспорт', 'номер', 'вечер', 'поезд', 'адрес', 'учитель', 'цвет',
+    'глаз', 'век', 'свет', 'хлеб', 'лес', 'берег', 'остров', 'голос', 'доктор', 'профессор', 'директор', 'повар'
+}
+
+# Masculine nouns that lose the vowel of their last syllable (подарок -> подарка)
+FLEETING_VOWEL = {'подарок', 'цветок', 'звонок', 'кусок', 'рынок', 'потолок', 'платок', 'рот', 'сон', 'угол'}
+
+# Uncountable and singular-only nouns: substances, abstractions, subjects and
+# sports. Their plurals are not drilled (no мебели, молоки, сахары).
+MASS_NOUNS = {
+    'мебель', 'молоко', 'здоровье', 'сахар', 'масло', 'пиво', 'сок', 'сыр', 'чай', 'вода',
+    'мясо', 'картошка', 'колбаса', 'одежда', 'погода', 'техника', 'транспорт', 'спорт', 'теннис',
+    'футбол', 'балет', 'биология', 'математика', 'медицина', 'физика', 'философия', 'экономика',
+    'литература', 'архитектура', 'музыка', 'милиция', 'образование', 'рождение',
+    'коммуникация', 'любовь'
+}
+
+# Forms the ending tables get wrong; only the differing forms are listed.
+# Accusatives follow from these overrides unless given explicitly.
+NOUN_EXCEPTIONS = {
+    "глаз": {"genitive_plural": "глаз"},
+    "цветок": {
+        "nominative_plural": "цветы", "genitive_plural": "цветов", "dative_plural": "цветам",
+        "instrumental_plural": "цветами", "prepositional_plural": "цветах"
+    },
+    "стул": {
+        "nominative_plural": "стулья", "genitive_plural": "стульев", "dative_plural": "стульям",
+        "instrumental_plural": "стульями", "prepositional_plural": "стульях"
+    },
+    "муж": {
+        "nominative_plural": "мужья", "genitive_plural": "мужей", "dative_plural": "мужьям",
+        "instrumental_plural": "мужьями", "prepositional_plural": "мужьях"
+    },
+    "сосед": {
+        "nominative_plural": "соседи", "genitive_plural": "соседей", "dative_plural": "соседям",
+        "instrumental_plural": "соседями", "prepositional_plural": "соседях"
+    },
+    "хозяин": {
+        "nominative_plural": "хозяева", "genitive_plural": "хозяев", "dative_plural": "хозяевам",
+        "instrumental_plural": "хозяевами", "prepositional_plural": "хозяевах"
+    },
+    "господин": {
+        "nominative_plural": "господа", "genitive_plural": "господ", "dative_plural": "господам",
+        "instrumental_plural": "господами", "prepositional_plural": "господах"
+    },
+    "конец": {"genitive_plural": "концов"},
+    "друг": {
+        "nominative_plural": "друзья", "genitive_plural": "друзей", "dative_plural": "друзьям",
+        "instrumental_plural": "друзьями", "prepositional_plural": "друзьях"
+    },
+    "брат": {
+        "nominative_plural": "братья", "genitive_plural": "братьев", "dative_plural": "братьям",
+        "instrumental_plural": "братьями", "prepositional_plural": "братьях"
+    },
+    "сын": {
+        "nominative_plural": "сыновья", "genitive_plural": "сыновей", "dative_plural": "сыновьям",
+        "instrumental_plural": "сыновьями", "prepositional_plural": "сыновьях"
+    },
+    "человек": {
+        "nominative_plural": "люди", "genitive_plural": "людей", "dative_plural": "людям",
+        "instrumental_plural": "людьми", "prepositional_plural": "людях"
+    },
+    "ребёнок": {
+        "genitive": "ребёнка", "dative": "ребёнку", "instrumental": "ребёнком", "prepositional": "ребёнке",
+        "nominative_plural": "дети", "genitive_plural": "детей", "dative_plural": "детям",
+        "instrumental_plural": "детьми", "prepositional_plural": "детях"
+    },
+    "англичанин": {
+        "nominative_plural": "англичане", "genitive_plural": "англичан", "dative_plural": "англичанам",
+        "instrumental_plural": "англичанами", "prepositional_plural": "англичанах"
+    },
+    "отец": {"genitive_plural": "отцов", "instrumental": "отцом"},
+    "день": {
+        "genitive": "дня", "dative": "дню", "instrumental": "днём", "prepositional": "дне",
+        "nominative_plural": "дни", "genitive_plural": "дней", "dative_plural": "дням",
+        "instrumental_plural": "днями", "prepositional_plural": "днях"
+    },
+    "мать": {
+        "genitive": "матери", "dative": "матери", "instrumental": "матерью", "prepositional": "матери",
+        "nominative_plural": "матери", "genitive_plural": "матерей", "dative_plural": "матерям",
+        "instrumental_plural": "матерями", "prepositional_plural": "матерях"
+    },
+    "дочь": {
+        "genitive": "дочери", "dative": "дочери", "instrumental": "дочерью", "prepositional": "дочери",
+        "nominative_plural": "дочери", "genitive_plural": "дочерей", "dative_plural": "дочерям",
+        "instrumental_plural": "дочерьми", "prepositional_plural": "дочерях"
+    },
+    "любовь": {
+        "genitive": "любви", "dative": "любви", "instrumental": "любовью", "prepositional": "любви",
+        "nominative_plural": "любови"
+    },
+    "время": {
+        "genitive": "времени", "dative": "времени", "instrumental": "временем", "prepositional": "времени",
+        "nominative_plural": "времена", "genitive_plural": "времён", "dative_plural": "временам",
+        "instrumental_plural": "временами", "prepositional_plural": "временах"
+    },
+    "имя": {
+        "genitive": "имени", "dative": "имени", "instrumental": "именем", "prepositional": "имени",
+        "nominative_plural": "имена", "genitive_plural": "имён", "dative_plural": "именам",
+        "instrumental_plural": "именами", "prepositional_plural": "именах"
+    },
+    "яйцо": {"genitive_plural": "яиц"},
+    "яблоко": {"nominative_plural": "яблоки"},
+    "солнце": {"genitive_plural": "солнц"},
+    "платье": {"genitive_plural": "платьев"},
+    "волна": {"genitive_plural": "волн"},
+    "игла": {"genitive_plural": "игл"},
+    "сестра": {"genitive_plural": "сестёр"},
+    "тётя": {"genitive_plural": "тётей"},
+    "дядя": {"genitive_plural": "дядей"},
+    "кухня": {"genitive_plural": "кухонь"},
+    "песня": {"genitive_plural": "песен"},
+    "деревня": {"genitive_plural": "деревень"},
+}
+
+
+def _join(stem: str, ending: str) -> str:
+    """Attach an ending, applying the spelling rules (no ы after velars and sibilants, no я/ю after sibilants and ц)"""
+    if stem and ending:
+        last, first = stem[-1], ending[0]
+        if first == 'ы' and (last in VELARS or last in SIBILANTS):
+            ending = 'и' + ending[1:]
+        elif first == 'я' and (last in SIBILANTS or last == 'ц'):
+            ending = 'а' + ending[1:]
+        elif first == 'ю' and (last in SIBILANTS or last == 'ц'):
+            ending = 'у' + ending[1:]
+    return stem + ending
+
+
+def _zero_ending(stem: str) -> str:
+    """
+    Genitive plural with no ending, inserting the fleeting vowel that breaks
+    up a final consonant cluster: before -к (ручек, тарелок), after a soft
+    sign (писем) and before -л/-н/-ц (масел, окон, колец)
+    """
+    if len(stem) < 2 or stem[-1] in VOWELS or stem[-2] in VOWELS:
+        return stem
+    before, last = stem[-2], stem[-1]
+    if last == 'к':
+        if before == 'ь' or before == 'й':
+            return stem[:-2] + 'ек'
+        if before in SIBILANTS:
+            return stem[:-1] + 'ек'
+        return stem[:-1] + 'ок'
+    if before == 'ь':
+        return stem[:-2] + 'е' + last
+    if last in 'лнц' and before != last and before != 'й':
+        return stem[:-1] + ('о' if before in VELARS else 'е') + last
+    return stem
+
+
+def infer_declension(nominative: str, gender: Optional[str] = None) -> str:
+    """Declension class (first, second, third) from the ending and gender"""
+    if nominative.endswith(('а', 'я')) and not nominative.endswith('мя'):
+        return 'second'
+    if nominative.endswith('ь') and gender != 'masculine':
+        return 'third'
+    return 'first'
+
+
+def infer_gender(nominative: str) -> str:
+    """Most likely gender from the ending (-ь nouns default to feminine)"""
+    if nominative.endswith(('а', 'я')) and not nominative.endswith('мя'):
+        return 'feminine'
+    if nominative.endswith(('о', 'е', 'ё')) or nominative.endswith('мя'):
+        return 'neuter'
+    if nominative.endswith('ь'):
+        return 'feminine'
+    return 'masculine'
+
+
+def _first_masculine(nom: str) -> Dict[str, str]:
+    if nom.endswith(('й', 'ь')):
+        stem = nom[:-1]
+        soft_i = nom.endswith('ий')
+        return {
+            'genitive': _join(stem, 'я'), 'dative': _join(stem, 'ю'), 'instrumental': stem + 'ем',
+            'prepositional': stem + ('и' if soft_i else 'е'),
+            'nominative_plural': stem + ('я' if nom in A_PLURALS else 'и'),
+            'genitive_plural': stem + ('ев' if nom.endswith('й') else 'ей'),
+            'dative_plural': _join(stem, 'ям'), 'instrumental_plural': _join(stem, 'ями'),
+            'prepositional_plural': _join(stem, 'ях')
+        }
+
+    stem = nom
+    # Fleeting -е- in -ец (немец -> немца)
+    if nom.endswith('ец') and len(nom) > 3:
+        stem = nom[:-2] + 'ц'
+    elif nom in FLEETING_VOWEL:
+        stem = nom[:-2] + nom[-1]
+    last = stem[-1]
+    if last in SIBILANTS:
+        genitive_plural = stem + 'ей'
+    elif last == 'ц':
+        genitive_plural = stem + 'ев'
+    else:
+        genitive_plural = stem + 'ов'
+    return {
+        'genitive': stem + 'а', 'dative': stem + 'у',
+        'instrumental': stem + ('ем' if last == 'ц' else 'ом'),
+        'prepositional': stem + 'е',
+        'nominative_plural': stem + 'а' if nom in A_PLURALS else _join(stem, 'ы'),
+        'genitive_plural': genitive_plural, 'dative_plural': stem + 'ам', 'instrumental_plural': stem + 'ами', 'prepositional_plural': stem + 'ах'
+    }
+
+
+def _first_neuter(nom: str) -> Dict[str, str]:
+    stem = nom[:-1]
+    if nom.endswith('о'):
+        return {
+            'genitive': stem + 'а', 'dative': stem + 'у', 'instrumental': stem + 'ом', 'prepositional': stem + 'е',
+            'nominative_plural': stem + 'а', 'genitive_plural': _zero_ending(stem),
+            'dative_plural': stem + 'ам', 'instrumental_plural': stem + 'ами', 'prepositional_plural': stem + 'ах'
+        }
+
+    # -е / -ё / -ие / -ье
+    ie = nom.endswith('ие')
+    if ie:
+        genitive_plural = stem + 'й'
+    elif nom[-2:] in ('ье', 'ьё'):
+        genitive_plural = stem[:-1] + 'ий'
+    elif stem[-1] in SIBILANTS or stem[-1] == 'ц':
+        genitive_plural = _zero_ending(stem)
+    else:
+        genitive_plural = stem + 'ей'
+    return {
+        'genitive': _join(stem, 'я'), 'dative': _join(stem, 'ю'), 'instrumental': stem + 'ем',
+        'prepositional': stem + ('и' if ie else 'е'),
+        'nominative_plural': _join(stem, 'я'),
+        'genitive_plural': genitive_plural,
+        'dative_plural': _join(stem, 'ям'), 'instrumental_plural': _join(stem, 'ями'),
+        'prepositional_plural': _join(stem, 'ях')
+    }
+
+
+def _second(nom: str) -> Dict[str, str]:
+    stem = nom[:-1]
+    if nom.endswith('а'):
+        last = stem[-1]
+        return {
+            'genitive': _join(stem, 'ы'), 'dative': stem + 'е', 'accusative': stem + 'у',
+            # Unstressed -ей after sibilants and ц is the common case (улицей, кашей)
+            'instrumental': stem + ('ей' if last in SIBILANTS or last == 'ц' else 'ой'),
+            'prepositional': stem + 'е',
+            'nominative_plural': _join(stem, 'ы'), 'genitive_plural': _zero_ending(stem),
+            'dative_plural': stem + 'ам', 'instrumental_plural': stem + 'ами', 'prepositional_plural': stem + 'ах'
+        }
+
+    # -я / -ия / -ья
+    ia = nom.endswith('ия')
+    if ia:
+        genitive_plural = stem + 'й'
+    elif nom.endswith('ья'):
+        genitive_plural = stem[:-1] + 'ей'
+    elif stem[-1] in VOWELS:
+        genitive_plural = stem + 'й'
+    else:
+        genitive_plural = stem + 'ь'
+    return {
+        'genitive': stem + 'и', 'dative': stem + ('и' if ia else 'е'), 'accusative': stem + 'ю',
+        'instrumental': stem + 'ей', 'prepositional': stem + ('и' if ia else 'е'),
+        'nominative_plural': stem + 'и', 'genitive_plural': genitive_plural,
+        'dative_plural': stem + 'ям', 'instrumental_plural': stem + 'ями', 'prepositional_plural': stem + 'ях'
+    }
+
+
+def _third(nom: str) -> Dict[str, str]:
+    stem = nom[:-1]
+    return {
+        'genitive': stem + 'и', 'dative': stem + 'и', 'accusative': nom, 'instrumental': nom + 'ю',
+        'prepositional': stem + 'и',
+        'nominative_plural': stem + 'и', 'genitive_plural': stem + 'ей',
+        'dative_plural': _join(stem, 'ям'), 'instrumental_plural': _join(stem, 'ями'),
+        'prepositional_plural': _join(stem, 'ях')
+    }
+
+
+@lru_cache(maxsize=4096)
+def _paradigm(nominative: str, gender: str, declension: str, animate: bool) -> Tuple[Tuple[str, str], ...]:
+    """All forms of one noun as (key, form) pairs; cached, so kept immutable"""
+    if nominative in INDECLINABLE:
+        forms = {case: nominative for case in CASES}
+        forms.update({case + '_plural': nominative for case in CASES})
+        return tuple(forms.items())
+
+    if declension == 'second':
+        forms = _second(nominative)
+    elif declension == 'third':
+        forms = _third(nominative)
+    elif gender == 'neuter':
+        forms = _first_neuter(nominative)
+    else:
+        forms = _first_masculine(nominative)
+
+    forms['nominative'] = nominative
+    forms.update(NOUN_EXCEPTIONS.get(nominative, {}))
+
+    # Animate accusatives take the genitive form (masculine singular and all plurals)
+    if 'accusative' not in forms:
+        forms['accusative'] = forms['genitive'] if animate and gender == 'masculine' else nominative
+    if 'accusative_plural' not in forms:
+        forms['accusative_plural'] = forms['genitive_plural'] if animate else forms['nominative_plural']
+
+    ordered = [(case, forms[case]) for case in CASES]
+    ordered += [(case + '_plural', forms[case + '_plural']) for case in CASES]
+    return tuple(ordered)
+
+
+def decline_noun(nominative: str, gender: Optional[str] = None, declension: Optional[str] = None,
+                 animate: bool = False) -> Dict[str, str]:
+    """
+    Every case form of a noun, singular and plural
+
+    Keys are the case names (nominative ... prepositional) and the same with
+    a '_plural' suffix. Gender and declension are inferred from the ending
+    when not given.
+    """
+    gender = gender or infer_gender(nominative)
+    declension = declension or infer_declension(nominative, gender)
+    return dict(_paradigm(nominative, gender, declension, animate))
+
+
+# SMARTool POS tag parts (N.Masc.Anim) -> gender
+TAG_GENDERS = {'Masc': 'masculine', 'Fem': 'feminine', 'Neut': 'neuter'}
+
+
+def parse_noun_tag(pos: str) -> Optional[Tuple[Optional[str], bool]]:
+    """(gender, animate) from a SMARTool noun tag like N.Fem.Anim, or None for other POS"""
+    parts = pos.split('.')
+    if parts[0] != 'N':
+        return None
+    gender = next((TAG_GENDERS[part] for part in parts if part in TAG_GENDERS), None)
+    return gender, 'Anim' in parts
+
+
 class Noun:
     def __init__(self, nominative, genitive, dative, accusative, instrumental, prepositional):
         self.nominative = nominative
@@ -7,6 +367,12 @@ class Noun:
         self.instrumental = instrumental
         self.prepositional = prepositional
 
+    @classmethod
+    def from_paradigm(cls, nominative, gender=None, animate=False):
+        forms = decline_noun(nominative, gender, animate=animate)
+        return cls(nominative, forms['genitive'], forms['dative'], forms['accusative'],
+                   forms['instrumental'], forms['prepositional'])
+
     def declension_cases(self):
         return {
             "Nominative": self.nominative,
@@ -19,11 +385,11 @@ class Noun:
 
 # List of Russian nouns with their declensions
 nouns_list = [
-    Noun("стол", "стола", "столу", "стол", "столом", "столе"),  # table
-    Noun("книга", "книги", "книге", "книгу", "книгой", "книге"),  # book
-    Noun("дом", "дома", "дому", "дом", "домом", "доме"),  # house
-    Noun("машина", "машины", "машине", "машину", "машиной", "машине"),  # car
-    Noun("человек", "человека", "человеку", "человека", "человеком", "человеке"),  # person
+    Noun.from_paradigm("стол"),  # table
+    Noun.from_paradigm("книга"),  # book
+    Noun.from_paradigm("дом"),  # house
+    Noun.from_paradigm("машина"),  # car
+    Noun.from_paradigm("человек", animate=True),  # person
 ]
 
 def get_noun_declension(noun):
@@ -33,4 +399,4 @@ def get_noun_declension(noun):
     return None
 
 def list_all_nouns():
-    return [noun.nominative for noun in nouns_list]
\ No newline at end of file
+    return [noun.nominative for noun in nouns_list]
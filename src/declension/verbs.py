@@ -0,0 +1,356 @@
+"""
+Rule-based Russian verb conjugation
+
+conjugate_verb() derives the non-past (present for imperfective verbs,
+future for perfective ones) and past forms from the infinitive and its
+conjugation class. Regular first conjugation verbs (-ать/-ять/-еть,
+-авать, -овать/-евать, -еять/-аять, -ыть/-оть) and second conjugation verbs (-ить plus
+the -ать/-еть exceptions in irregular_verbs.txt) follow the ending tables
+below, with the consonant alternation in the first person singular
+(видеть -> вижу, любить -> люблю). The prefixed -йти (уйти, прийти) and
+-нять (понять, снять) families have their own rules. Reflexive verbs are
+conjugated without -ся/-сь and the particle is added back. Verbs whose
+stems change (писать, идти, мочь) are listed in VERB_EXCEPTIONS, which also
+covers their prefixed forms (написать, смочь, умереть; after the stressed
+вы- the endings lose their ё: выпьешь). Infinitives none of this covers
+(most -ти/-чь/-нуть verbs, and short -ать verbs whose consonant may
+alternate, like искать -> ищу) are rejected rather than guessed; check them
+with can_conjugate(). Conjugations are memoized.
+"""
+import os
+from functools import lru_cache
+from typing import Dict, FrozenSet, Optional, Tuple
+from declension.nouns import SIBILANTS, VOWELS
+
+PERSONS = ('я', 'ты', 'он', 'мы', 'вы', 'они')
+PAST_FORMS = ('masculine', 'feminine', 'neuter', 'plural')
+
+IRREGULAR_FILE = os.path.join(os.path.dirname(__file__), '..', '..', 'irregular_verbs.txt')
+
+# Second conjugation verbs in -ать/-ять/-еть besides those in irregular_verbs.txt
+SECOND_CONJUGATION = {'спать', 'лежать', 'стоять', 'боять', 'сидеть', 'лететь', 'висеть',
+                      'молчать', 'кричать', 'звучать', 'стучать', 'гореть', 'шуметь'}
+
+FIRST_ENDINGS = ('ю', 'ешь', 'ет', 'ем', 'ете', 'ют')
+STRESSED_FIRST_ENDINGS = ('ю', 'ёшь', 'ёт', 'ём', 'ёте', 'ют')
+SECOND_ENDINGS = ('ю', 'ишь', 'ит', 'им', 'ите', 'ят')
+
+# First person singular consonant alternations of the second conjugation
+ALTERNATIONS = (('ст', 'щ'), ('зд', 'зж'), ('б', 'бл'), ('п', 'пл'), ('в', 'вл'), ('ф', 'фл'),
+                ('м', 'мл'), ('д', 'ж'), ('з', 'ж'), ('с', 'ш'), ('т', 'ч'))
+
+# Prefixes under which an exception keeps its forms (написать, поехать, смочь)
+PREFIXES = ('в', 'вы', 'до', 'за', 'из', 'на', 'о', 'об', 'от', 'пере', 'по', 'под', 'при', 'про',
+            'рас', 'раз', 'с', 'со', 'у')
+
+# Stem-final consonants of -ать verbs that may alternate in the non-past
+# (плакать -> плачу, резать -> режу, махать -> машу)
+ALTERNATING_CONSONANTS = ('к', 'г', 'х', 'з', 'с')
+
+# Verbs the rules get wrong: non-past forms in PERSONS order and, where the
+# past does not follow the infinitive, past forms in PAST_FORMS order
+VERB_EXCEPTIONS = {
+    'гнать': {'nonpast': ('гоню', 'гонишь', 'гонит', 'гоним', 'гоните', 'гонят')},
+    'хотеть': {'nonpast': ('хочу', 'хочешь', 'хочет', 'хотим', 'хотите', 'хотят')},
+    'идти': {
+        'nonpast': ('иду', 'идёшь', 'идёт', 'идём', 'идёте', 'идут'),
+        'past': ('шёл', 'шла', 'шло', 'шли')
+    },
+    'пойти': {
+        'nonpast': ('пойду', 'пойдёшь', 'пойдёт', 'пойдём', 'пойдёте', 'пойдут'),
+        'past': ('пошёл', 'пошла', 'пошло', 'пошли')
+    },
+    'мочь': {
+        'nonpast': ('могу', 'можешь', 'может', 'можем', 'можете', 'могут'),
+        'past': ('мог', 'могла', 'могло', 'могли')
+    },
+    'есть': {
+        'nonpast': ('ем', 'ешь', 'ест', 'едим', 'едите', 'едят'),
+        'past': ('ел', 'ела', 'ело', 'ели')
+    },
+    'сесть': {
+        'nonpast': ('сяду', 'сядешь', 'сядет', 'сядем', 'сядете', 'сядут'),
+        'past': ('сел', 'села', 'село', 'сели')
+    },
+    'дать': {'nonpast': ('дам', 'дашь', 'даст', 'дадим', 'дадите', 'дадут')},
+    'быть': {'nonpast': ('буду', 'будешь', 'будет', 'будем', 'будете', 'будут')},
+    'стать': {'nonpast': ('стану', 'станешь', 'станет', 'станем', 'станете', 'станут')},
+    'брать': {'nonpast': ('беру', 'берёшь', 'берёт', 'берём', 'берёте', 'берут')},
+    'взять': {'nonpast': ('возьму', 'возьмёшь', 'возьмёт', 'возьмём', 'возьмёте', 'возьмут')},
+    'звать': {'nonpast': ('зову', 'зовёшь', 'зовёт', 'зовём', 'зовёте', 'зовут')},
+    'ехать': {'nonpast': ('еду', 'едешь', 'едет', 'едем', 'едете', 'едут')},
+    'ждать': {'nonpast': ('жду', 'ждёшь', 'ждёт', 'ждём', 'ждёте', 'ждут')},
+    'жить': {'nonpast': ('живу', 'живёшь', 'живёт', 'живём', 'живёте', 'живут')},
+    'петь': {'nonpast': ('пою', 'поёшь', 'поёт', 'поём', 'поёте', 'поют')},
+    'пить': {'nonpast': ('пью', 'пьёшь', 'пьёт', 'пьём', 'пьёте', 'пьют')},
+    'писать': {'nonpast': ('пишу', 'пишешь', 'пишет', 'пишем', 'пишете', 'пишут')},
+    'сказать': {'nonpast': ('скажу', 'скажешь', 'скажет', 'скажем', 'скажете', 'скажут')},
+    'казать': {'nonpast': ('кажу', 'кажешь', 'кажет', 'кажем', 'кажете', 'кажут')},
+    'здать': {'nonpast': ('здам', 'здашь', 'здаст', 'здадим', 'здадите', 'здадут')},
+    'бежать': {'nonpast': ('бегу', 'бежишь', 'бежит', 'бежим', 'бежите', 'бегут')},
+    'смеять': {'nonpast': ('смею', 'смеёшь', 'смеёт', 'смеём', 'смеёте', 'смеют')},
+    'искать': {'nonpast': ('ищу', 'ищешь', 'ищет', 'ищем', 'ищете', 'ищут')},
+    'плакать': {'nonpast': ('плачу', 'плачешь', 'плачет', 'плачем', 'плачете', 'плачут')},
+    'резать': {'nonpast': ('режу', 'режешь', 'режет', 'режем', 'режете', 'режут')},
+    'мазать': {'nonpast': ('мажу', 'мажешь', 'мажет', 'мажем', 'мажете', 'мажут')},
+    'вязать': {'nonpast': ('вяжу', 'вяжешь', 'вяжет', 'вяжем', 'вяжете', 'вяжут')},
+    'махать': {'nonpast': ('машу', 'машешь', 'машет', 'машем', 'машете', 'машут')},
+    'пахать': {'nonpast': ('пашу', 'пашешь', 'пашет', 'пашем', 'пашете', 'пашут')},
+    'прятать': {'nonpast': ('прячу', 'прячешь', 'прячет', 'прячем', 'прячете', 'прячут')},
+    'шептать': {'nonpast': ('шепчу', 'шепчешь', 'шепчет', 'шепчем', 'шепчете', 'шепчут')},
+    'сыпать': {'nonpast': ('сыплю', 'сыплешь', 'сыплет', 'сыплем', 'сыплете', 'сыплют')},
+    'начать': {'nonpast': ('начну', 'начнёшь', 'начнёт', 'начнём', 'начнёте', 'начнут')},
+    'деть': {'nonpast': ('дену', 'денешь', 'денет', 'денем', 'денете', 'денут')},
+    'мереть': {
+        'nonpast': ('мру', 'мрёшь', 'мрёт', 'мрём', 'мрёте', 'мрут'),
+        'past': ('мер', 'мерла', 'мерло', 'мерли')
+    },
+    'переть': {
+        'nonpast': ('пру', 'прёшь', 'прёт', 'прём', 'прёте', 'прут'),
+        'past': ('пер', 'перла', 'перло', 'перли')
+    },
+    'бить': {'nonpast': ('бью', 'бьёшь', 'бьёт', 'бьём', 'бьёте', 'бьют')},
+    'лить': {'nonpast': ('лью', 'льёшь', 'льёт', 'льём', 'льёте', 'льют')},
+    'шить': {'nonpast': ('шью', 'шьёшь', 'шьёт', 'шьём', 'шьёте', 'шьют')},
+    'плыть': {'nonpast': ('плыву', 'плывёшь', 'плывёт', 'плывём', 'плывёте', 'плывут')},
+    'нести': {
+        'nonpast': ('несу', 'несёшь', 'несёт', 'несём', 'несёте', 'несут'),
+        'past': ('нёс', 'несла', 'несло', 'несли')
+    },
+    'вести': {
+        'nonpast': ('веду', 'ведёшь', 'ведёт', 'ведём', 'ведёте', 'ведут'),
+        'past': ('вёл', 'вела', 'вело', 'вели')
+    },
+    'везти': {
+        'nonpast': ('везу', 'везёшь', 'везёт', 'везём', 'везёте', 'везут'),
+        'past': ('вёз', 'везла', 'везло', 'везли')
+    },
+    'лечь': {
+        'nonpast': ('лягу', 'ляжешь', 'ляжет', 'ляжем', 'ляжете', 'лягут'),
+        'past': ('лёг', 'легла', 'легло', 'легли')
+    },
+    'печь': {
+        'nonpast': ('пеку', 'печёшь', 'печёт', 'печём', 'печёте', 'пекут'),
+        'past': ('пёк', 'пекла', 'пекло', 'пекли')
+    },
+}
+
+# Endings the regular tables can take
+REGULAR_ENDINGS = ('ать', 'ять', 'еть', 'ить', 'ыть', 'оть')
+
+
+@lru_cache(maxsize=None)
+def load_irregular_verbs(irregular_file: str = IRREGULAR_FILE) -> FrozenSet[str]:
+    """Second conjugation -ать/-еть verbs listed in irregular_verbs.txt"""
+    irregular = set()
+    try:
+        with open(irregular_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                verb = line.strip()
+                if verb and not verb.startswith('#'):
+                    irregular.add(verb)
+    except FileNotFoundError:
+        print(f"⚠️  Warning: irregular_verbs.txt not found")
+
+    return frozenset(irregular)
+
+
+def split_reflexive(infinitive: str) -> Tuple[str, bool]:
+    """(infinitive without -ся/-сь, whether it was reflexive)"""
+    if infinitive.endswith(('ся', 'сь')):
+        return infinitive[:-2], True
+    return infinitive, False
+
+
+def _is_boundary(prefix: str, root: str) -> bool:
+    """
+    Whether prefix + root is a real prefixed form: со- only stands before
+    a consonant cluster (собрать, but солить is not со + лить), and a
+    consonant-final prefix meets a vowel-initial root only through ъ
+    """
+    if prefix == 'со':
+        return len(root) > 1 and root[0] not in VOWELS and root[1] not in VOWELS
+    return prefix[-1] in VOWELS or root[0] not in VOWELS
+
+
+def _find_listed(base: str, listed) -> Optional[Tuple[str, str]]:
+    """(prefix, listed verb) if base is a listed verb, bare or with a known prefix"""
+    if base in listed:
+        return '', base
+    for prefix in PREFIXES:
+        if not base.startswith(prefix):
+            continue
+        root = base[len(prefix):]
+        if root.startswith('ъ'):
+            # подъехать, съесть
+            prefix, root = prefix + 'ъ', root[1:]
+        elif not root or not _is_boundary(prefix, root):
+            continue
+        if root in listed:
+            return prefix, root
+    return None
+
+
+def infer_conjugation(infinitive: str) -> str:
+    """Conjugation class (I or II) from the infinitive"""
+    base, _ = split_reflexive(infinitive)
+    if _find_listed(base, SECOND_CONJUGATION | load_irregular_verbs()) is not None:
+        return 'II'
+    if base.endswith('ить') and _find_listed(base, VERB_EXCEPTIONS) is None:
+        return 'II'
+    return 'I'
+
+
+# Prefix forms with a linking о that only occur before -йти (войти, подойти)
+GO_PREFIXES = ('во', 'взо', 'изо', 'обо', 'ото', 'подо', 'разо')
+
+
+def _prefixed_root(base: str, root: str) -> Optional[str]:
+    """The prefix if base is a known prefix plus root (уйти -> у), else None"""
+    prefix = base[:-len(root)]
+    prefixes = PREFIXES + GO_PREFIXES if root == 'йти' else PREFIXES
+    if base.endswith(root) and prefix in prefixes:
+        return prefix
+    return None
+
+
+def _may_alternate(base: str) -> bool:
+    """
+    A short -ать verb (one-syllable stem) ending in a consonant that may
+    alternate: плакать, резать. Longer stems (завтракать, отдыхать) are
+    derived verbs, which keep their consonant.
+    """
+    if not base.endswith('ать'):
+        return False
+    stem = base[:-3]
+    syllables = sum(1 for char in stem if char in VOWELS)
+    if stem.endswith('ск') and stem != 'иск':
+        # пускать, таскать keep their ск
+        return False
+    return stem[-1:] in ALTERNATING_CONSONANTS and syllables <= 1
+
+
+def can_conjugate(infinitive: str) -> bool:
+    """Whether the rules and exceptions cover an infinitive (other verbs would get made-up forms)"""
+    base, _ = split_reflexive(infinitive)
+    if ' ' in base:
+        return False
+    if _find_listed(base, VERB_EXCEPTIONS) is not None:
+        return True
+    if _prefixed_root(base, 'йти') is not None or _prefixed_root(base, 'нять') is not None:
+        return True
+    if _may_alternate(base) and infer_conjugation(infinitive) == 'I':
+        return False
+    return base.endswith(REGULAR_ENDINGS) and not base.endswith('ереть')
+
+
+def _add_reflexive(form: str) -> str:
+    """-сь after a vowel, -ся after a consonant"""
+    return form + ('сь' if form[-1] in VOWELS else 'ся')
+
+
+def _go(prefix: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Non-past and past of a prefixed идти (уйти, прийти, выйти)"""
+    stem = 'при' if prefix == 'при' else prefix + 'й'
+    endings = FIRST_ENDINGS if prefix == 'вы' else STRESSED_FIRST_ENDINGS
+    nonpast = tuple(stem + 'д' + ending for ending in ('у',) + endings[1:5] + ('ут',))
+    masculine = prefix + ('шел' if prefix == 'вы' else 'шёл')
+    return nonpast, (masculine, prefix + 'шла', prefix + 'шло', prefix + 'шли')
+
+
+def _take(prefix: str) -> Tuple[str, ...]:
+    """Non-past of a prefixed -нять verb (понять -> пойму, снять -> сниму)"""
+    if prefix == 'при':
+        return tuple('прим' + ending for ending in ('у', 'ешь', 'ет', 'ем', 'ете', 'ут'))
+    if prefix[-1] in VOWELS:
+        return tuple(prefix + 'йм' + ending for ending in ('у', 'ёшь', 'ёт', 'ём', 'ёте', 'ут'))
+    return tuple(prefix + 'ним' + ending for ending in ('у', 'ешь', 'ет', 'ем', 'ете', 'ут'))
+
+
+def _first(base: str) -> Tuple[str, ...]:
+    if base.endswith(('ыть', 'оть')):
+        # мыть -> мою, открыть -> открою, колоть -> колю
+        stem = base[:-3] + ('о' if base.endswith('ыть') else '')
+        return tuple(stem + ending for ending in FIRST_ENDINGS)
+    if base.endswith(('овать', 'евать')) and len(base) > 5:
+        stem = base[:-5]
+        stem += 'ю' if stem[-1] in VOWELS else 'у'
+        return tuple(stem + ending for ending in FIRST_ENDINGS)
+    if base.endswith('авать'):
+        return tuple(base[:-4] + ending for ending in STRESSED_FIRST_ENDINGS)
+    if base.endswith(('еять', 'аять')):
+        # надеяться -> надеюсь, таять -> таю
+        return tuple(base[:-3] + ending for ending in FIRST_ENDINGS)
+    return tuple(base[:-2] + ending for ending in FIRST_ENDINGS)
+
+
+def _second(base: str) -> Tuple[str, ...]:
+    stem = base[:-3]
+    hushing = stem[-1] in SIBILANTS
+    first_person = stem
+    for consonant, replacement in ALTERNATIONS:
+        if stem.endswith(consonant):
+            first_person = stem[:-len(consonant)] + replacement
+            break
+
+    forms = [first_person + ('у' if first_person[-1] in SIBILANTS else 'ю')]
+    forms += [stem + ending for ending in SECOND_ENDINGS[1:5]]
+    forms.append(stem + ('ат' if hushing else 'ят'))
+    return tuple(forms)
+
+
+@lru_cache(maxsize=4096)
+def _conjugation(infinitive: str, conjugation: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """(non-past forms, past forms) of one verb; cached, so kept immutable"""
+    base, reflexive = split_reflexive(infinitive)
+
+    nonpast = past = None
+    listed = _find_listed(base, VERB_EXCEPTIONS)
+    if listed is None and _prefixed_root(base, 'йти') is not None:
+        nonpast, past = _go(_prefixed_root(base, 'йти'))
+    elif listed is None and _prefixed_root(base, 'нять') is not None:
+        nonpast = _take(_prefixed_root(base, 'нять'))
+    elif listed is not None:
+        prefix, verb = listed
+        exception = VERB_EXCEPTIONS[verb]
+        nonpast = tuple(prefix + form for form in exception['nonpast'])
+        if 'past' in exception:
+            past = tuple(prefix + form for form in exception['past'])
+        if prefix == 'вы':
+            # вы- takes the stress, so stressed ё endings turn into е (выпьешь, вынес)
+            nonpast = tuple(form.replace('ё', 'е') for form in nonpast)
+            past = past and tuple(form.replace('ё', 'е') for form in past)
+
+    if nonpast is None:
+        nonpast = _second(base) if conjugation == 'II' else _first(base)
+    if past is None:
+        stem = base[:-2] + 'л'
+        past = (stem, stem + 'а', stem + 'о', stem + 'и')
+
+    if reflexive:
+        nonpast = tuple(_add_reflexive(form) for form in nonpast)
+        past = tuple(_add_reflexive(form) for form in past)
+    return nonpast, past
+
+
+def conjugate_verb(infinitive: str, conjugation: Optional[str] = None,
+                   aspect: str = 'imperfective') -> Dict[str, Dict[str, str]]:
+    """
+    Non-past and past forms of a verb
+
+    The non-past forms are keyed 'present' for imperfective verbs and
+    'future' for perfective ones, by person pronoun (я ... они); past forms
+    are keyed by gender and 'plural'. The conjugation class is inferred
+    when not given. Raises ValueError for infinitives can_conjugate()
+    rejects.
+    """
+    if not can_conjugate(infinitive):
+        raise ValueError(f"No conjugation rule covers: {infinitive}")
+    if conjugation not in ('I', 'II'):
+        conjugation = infer_conjugation(infinitive)
+    nonpast, past = _conjugation(infinitive, conjugation)
+    tense = 'future' if aspect == 'perfective' else 'present'
+    return {
+        tense: dict(zip(PERSONS, nonpast)),
+        'past': dict(zip(PAST_FORMS, past))
+    }
@@ -1,13 +1,8 @@
 import random
-from data.noun_database import NounDatabase
-from data.adjective_database import AdjectiveDatabase
-from data.pronoun_database import PronounDatabase
-from data.word_pair_database import WordPairDatabase
-from data.verb_database import VerbDatabase
+from data.registry import get_registry
 from quiz.quiz_engine import QuizEngine
 from quiz.exam_prep import ExamPrep
-from quiz.word_practice import WordPractice
-from utils.display import display_feedback, display_results
+from utils.display import display_feedback, display_form_diagnosis, display_results
 from utils.input_helpers import get_yes_no_input, get_quit_input
 from utils.declension_rules import (
     display_noun_declension_rules,
@@ -56,8 +51,8 @@ def view_declension_rules():
 
 def learn_nouns():
     """Interactive noun learning with practice quiz"""
-    noun_db = NounDatabase()
-    nouns = noun_db.get_all_nouns()
+    registry = get_registry()
+    form_index = registry.form_index
     
     print("\n=== LEARN RUSSIAN NOUNS ===\n")
     print("💡 Tip: Review the noun declension rules before practicing!")
@@ -67,6 +62,12 @@ def learn_nouns():
         display_noun_declension_rules()
         input("\nPress Enter to continue...")
     
+    if get_yes_no_input("\nInclude nouns from the vocabulary list? (y/n): "):
+        noun_db = registry.vocabulary_noun_db
+    else:
+        noun_db = registry.noun_db
+    nouns = noun_db.get_all_nouns()
+    
     # Choose practice mode
     print("\nChoose practice mode:")
     print("1. Singular Forms (By Declension)")
@@ -150,6 +151,7 @@ def learn_nouns():
                 correct_in_row += 1
             else:
                 display_feedback(False, correct_form)
+                display_form_diagnosis(form_index, user_answer, noun_word, correct_form)
                 correct_in_row = 0
                 
                 # Make user write correct answer
@@ -191,8 +193,7 @@ def learn_nouns():
 
 def learn_adjectives():
     """Interactive adjective learning with practice quiz"""
-    adj_db = AdjectiveDatabase()
-    adjectives = adj_db.get_all_adjectives()
+    registry = get_registry()
     
     print("\n=== LEARN RUSSIAN ADJECTIVES ===\n")
     print("💡 Tip: Review the adjective declension rules before practicing!")
@@ -202,6 +203,12 @@ def learn_adjectives():
         display_adjective_declension_rules()
         input("\nPress Enter to continue...")
     
+    if get_yes_no_input("\nInclude adjectives from the vocabulary list? (y/n): "):
+        adj_db = registry.vocabulary_adjective_db
+    else:
+        adj_db = registry.adjective_db
+    adjectives = adj_db.get_all_adjectives()
+    
     # Choose practice mode
     print("\nChoose practice mode:")
     print("1. All forms (mixed)")
@@ -344,7 +351,7 @@ def learn_adjectives():
 
 def learn_pronouns():
     """Interactive personal pronoun learning with practice quiz"""
-    pronoun_db = PronounDatabase()
+    pronoun_db = get_registry().pronoun_db
     pronouns = pronoun_db.get_all_pronouns()
     
     print("\n=== LEARN RUSSIAN PERSONAL PRONOUNS ===\n")
@@ -435,9 +442,10 @@ def learn_pronouns():
 
 def learn_word_pairs():
     """Interactive learning of adjective-noun pairs with practice quiz"""
-    pair_db = WordPairDatabase()
-    noun_db = NounDatabase()
-    adj_db = AdjectiveDatabase()
+    registry = get_registry()
+    pair_db = registry.pair_db
+    noun_db = registry.noun_db
+    adj_db = registry.adjective_db
     
     print("\n=== LEARN RUSSIAN ADJECTIVE-NOUN PAIRS ===\n")
     print("📚 СЛОВООБРАЗОВАНИЕ & КОНГРУЭНС (Word Formation & Agreement)")
@@ -578,10 +586,11 @@ def learn_word_pairs():
 
 def take_quiz():
     """Run a comprehensive quiz on nouns, adjectives, pronouns, and word pairs"""
-    noun_db = NounDatabase()
-    adj_db = AdjectiveDatabase()
-    pronoun_db = PronounDatabase()
-    pair_db = WordPairDatabase()
+    registry = get_registry()
+    noun_db = registry.noun_db
+    adj_db = registry.adjective_db
+    pronoun_db = registry.pronoun_db
+    pair_db = registry.pair_db
     
     quiz_engine = QuizEngine(
         noun_db.get_all_nouns(),
@@ -602,10 +611,11 @@ def take_quiz():
 def exam_preparation_mode():
     """Exam preparation mode with focus on exam-relevant cases"""
     # Initialize databases
-    noun_db = NounDatabase()
-    adj_db = AdjectiveDatabase()
-    pronoun_db = PronounDatabase()
-    pair_db = WordPairDatabase()
+    registry = get_registry()
+    noun_db = registry.noun_db
+    adj_db = registry.adjective_db
+    pronoun_db = registry.pronoun_db
+    pair_db = registry.pair_db
     
     exam_prep = ExamPrep(noun_db, adj_db, pronoun_db, pair_db)
     
@@ -641,6 +651,11 @@ def exam_preparation_mode():
 
 def word_practice_mode():
     """Word practice mode with intelligent tracking"""
+    # The shared lexicon loads quietly, so report here what loading it took,
+    # only when entering the mode actually (re)loaded a CSV
+    for report in get_registry().lexicon.load().values():
+        print("\n" + report.summary())
+    
     while True:
         print("\n" + "=" * 50)
         print("  📚 WORD PRACTICE MODE")
@@ -663,7 +678,7 @@ def word_practice_mode():
 
 def _run_word_practice_session(use_norwegian: bool):
     """Run word practice session with selected language"""
-    word_practice = WordPractice(use_norwegian=use_norwegian)
+    word_practice = get_registry().word_practice(use_norwegian)
     
     while True:
         language = "Norwegian" if use_norwegian else "English"
@@ -716,8 +731,8 @@ def view_verb_conjugation_rules():
 
 def learn_verbs():
     """Interactive verb conjugation learning with practice quiz"""
-    verb_db = VerbDatabase()
-    verbs = verb_db.get_all_verbs()
+    registry = get_registry()
+    form_index = registry.form_index
     
     print("\n=== LEARN RUSSIAN VERBS ===\n")
     print("💡 Tip: Review conjugation patterns before practicing!")
@@ -727,6 +742,12 @@ def learn_verbs():
         display_conjugation_patterns()
         input("\nPress Enter to continue...")
     
+    if get_yes_no_input("\nInclude verbs from the vocabulary list? (y/n): "):
+        verb_db = registry.vocabulary_verb_db
+    else:
+        verb_db = registry.verb_db
+    verbs = verb_db.get_all_verbs()
+    
     # Choose practice mode
     print("\nChoose practice mode:")
     print("1. Present Tense (Conjugation I)")
@@ -806,6 +827,7 @@ def learn_verbs():
                         correct_count += 1
                     else:
                         display_feedback(False, correct_form)
+                        display_form_diagnosis(form_index, user_answer, infinitive, correct_form)
         
         if session_aborted:
             break
@@ -833,6 +855,7 @@ def learn_verbs():
                     correct_count += 1
                 else:
                     display_feedback(False, correct_form)
+                    display_form_diagnosis(form_index, user_answer, infinitive, correct_form)
         
         if session_aborted:
             break
@@ -904,6 +927,8 @@ def main():
         elif choice == '10':
             view_verb_conjugation_rules()
         elif choice == '11':
+            # Flushes the buffered practice statistics and releases the datasets
+            get_registry().invalidate()
             print("\n👋 Goodbye! Keep practicing your Russian!")
             break
         else:
@@ -1,25 +1,29 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
+from data.form_index import FormIndex
 from data.word_practice_database import WordPracticeDatabase
-from data.vocabulary_extractor import VocabularyExtractor
-from data.russian_norwegian_extractor import RussianNorwegianExtractor
-from utils.display import display_feedback
+from data.lexicon import Lexicon
+from utils.display import display_feedback, format_timestamp
 from utils.input_helpers import get_quit_input
 
 class WordPractice:
     """Interactive word practice with intelligent rotation and tracking"""
     
-    def __init__(self, use_norwegian: bool = False):
+    def __init__(self, use_norwegian: bool = False, lexicon: Optional[Lexicon] = None,
+                 db: Optional[WordPracticeDatabase] = None, form_index: Optional[FormIndex] = None):
         self.use_norwegian = use_norwegian
+        self.language = 'norwegian' if use_norwegian else 'english'
         
-        if use_norwegian:
-            self.extractor = RussianNorwegianExtractor()
-        else:
-            self.extractor = VocabularyExtractor()
+        # Both practice directions read the same merged lexicon
+        self.lexicon = lexicon or Lexicon()
+        
+        # Buffer writes during a session; they are flushed at end_session
+        self.db = db or WordPracticeDatabase(buffered=True)
         
-        self.db = WordPracticeDatabase()
+        # Answers ending in '?' list the known words they start (no index: no hints)
+        self.form_index = form_index
         
         # Check if CSV file exists
-        if not self.extractor.check_csv_file():
+        if not self.lexicon.sources[self.language].check_csv_file():
             print("\n⚠️  Warning: Could not load vocabulary data")
             print("   Make sure the CSV file is in the correct location")
 
@@ -27,6 +31,20 @@ class WordPractice:
         """Normalize user answer for comparison"""
         return answer.lower().strip()
     
+    def read_answer(self, prompt: str) -> str:
+        """Read an answer, first listing completions for any 'prefix?' typed"""
+        while True:
+            answer = input(prompt).strip()
+            if self.form_index is None or len(answer) < 2 or not answer.endswith('?'):
+                return answer
+            
+            prefix = answer[:-1].strip()
+            completions = self.form_index.complete(prefix, limit=8)
+            if completions:
+                print(f"   💡 Starting with '{prefix}': {', '.join(completions)}")
+            else:
+                print(f"   💡 No known words start with '{prefix}'")
+    
     def check_answer(self, user_answer: str, correct_answer: str) -> bool:
         """Check if user answer matches (with some flexibility)"""
         user_normalized = self.normalize_answer(user_answer)
@@ -52,7 +70,7 @@ class WordPractice:
         print("=" * 60)
         
         # Get all available words
-        all_words = self.extractor.extract_unique_words()
+        all_words = self.lexicon.words(self.language)
         
         if not all_words:
             print("\n❌ No words found in database. Please check CSV file.")
@@ -62,7 +80,7 @@ class WordPractice:
         
         # Show appropriate filter options based on mode
         if self.use_norwegian:
-            # Norwegian mode - filter by verb prefix "å"
+            # Norwegian mode - verbs are the entries whose translation is an infinitive
             print("\nPractice mode:")
             print("1. All words (mixed)")
             print("2. Verbs only")
@@ -70,8 +88,7 @@ class WordPractice:
             choice = input("\nEnter choice (1-2, default=1): ").strip()
             
             if choice == '2':
-                # Filter words where Norwegian translation starts with "å"
-                words_pool = [w for w in all_words if w.get('norwegian', '').startswith('å')]
+                words_pool = self.lexicon.query(self.language, pos='V')
                 print(f"📝 Practicing verbs only ({len(words_pool)} words available)")
             else:
                 words_pool = all_words
@@ -87,13 +104,13 @@ class WordPractice:
             choice = input("\nEnter choice (1-4, default=1): ").strip()
             
             if choice == '2':
-                words_pool = self.extractor.get_words_by_pos('N')
+                words_pool = self.lexicon.query(self.language, pos='N')
                 print(f"📝 Practicing nouns only ({len(words_pool)} words available)")
             elif choice == '3':
-                words_pool = self.extractor.get_words_by_pos('V')
+                words_pool = self.lexicon.query(self.language, pos='V')
                 print(f"📝 Practicing verbs only ({len(words_pool)} words available)")
             elif choice == '4':
-                words_pool = self.extractor.get_words_by_pos('A')
+                words_pool = self.lexicon.query(self.language, pos='A')
                 print(f"📝 Practicing adjectives only ({len(words_pool)} words available)")
             else:
                 words_pool = all_words
@@ -113,6 +130,8 @@ class WordPractice:
         print(f"\n🎯 Session: {len(practice_words)} words")
         print("=" * 60)
         print("\n💡 Tip: Type 'quit' or 'q' at any time to exit the session")
+        if self.form_index is not None:
+            print("💡 Tip: Type the first letters of a word and '?' (e.g. 'кни?') to see words starting with them")
         
         input("\nPress Enter to start...")
         
@@ -124,17 +143,17 @@ class WordPractice:
         
         # Practice each word
         for i, word in enumerate(practice_words, 1):
-            russian = word['russian']
+            russian = word.russian
             
             # Use correct translation based on language mode
+            # (every sense the lemma has in that language)
+            translation = '; '.join(self.lexicon.glosses(russian, self.language))
             if self.use_norwegian:
-                translation = word.get('norwegian', word.get('english', ''))
                 target_lang = "Norwegian"
             else:
-                translation = word.get('english', word.get('norwegian', ''))
                 target_lang = "English"
             
-            pos = word.get('pos', '')
+            pos = word.pos or ''
             
             # Add to session (uses Russian as key for consistent tracking)
             self.db.add_word_to_session(session_id, russian)
@@ -157,8 +176,7 @@ class WordPractice:
             # Display question based on direction
             if self.use_norwegian:
                 print(f"\n📖 Translate to Russian: {translation}")
-                # Show if it's a verb by checking "å" prefix
-                if translation.startswith('å'):
+                if pos.startswith('V'):
                     print(f"   (Verb)")
             else:
                 print(f"\n📖 Translate to {target_lang}: {translation}")
@@ -166,7 +184,7 @@ class WordPractice:
                 if pos:
                     print(f"   Part of speech: {pos}")
             
-            user_answer = input("\n   Your answer: ").strip()
+            user_answer = self.read_answer("\n   Your answer: ")
             
             # Check if user wants to quit
             if get_quit_input(user_answer):
@@ -298,8 +316,14 @@ class WordPractice:
         print(f"  Total words practiced: {stats['total_words_practiced']}")
         print(f"  ✅ Mastered words (level 4-5, 80%+ accuracy): {stats['mastered_words']}")
         print(f"  ⚠️  Needs review (low accuracy/proficiency): {stats['needs_review']}")
+        print(f"  🔁 Due for spaced repetition now: {len(self.db.get_due_words())}")
         print(f"  Overall accuracy: {stats['accuracy']:.1f}%")
         
+        print(f"\n⭐ Mastery Levels:")
+        for level in range(5, -1, -1):
+            label = '⭐' * level if level > 0 else '—'
+            print(f"  {label:<6} level {level}: {stats['mastery_histogram'][level]} words")
+        
         print(f"\n📝 Practice History:")
         print(f"  Total sessions: {stats['total_sessions']}")
         print(f"  Total attempts: {stats['total_attempts']}")
@@ -316,7 +340,7 @@ class WordPractice:
                     if total_questions > 0:
                         accuracy = (session['correct_count'] / total_questions * 100)
                         print(f"\n  Session {i}:")
-                        print(f"    Date: {session['start_time'][:10]}")
+                        print(f"    Date: {format_timestamp(session['start_time'])}")
                         print(f"    Score: {session['correct_count']}/{total_questions}")
                         print(f"    Accuracy: {accuracy:.1f}%")
         
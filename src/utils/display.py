@@ -1,3 +1,6 @@
+from datetime import datetime
+from data.form_index import normalize_form
+
 def display_instructions():
     instructions = (
         "Welcome to the Russian Declension Tutor!\n"
@@ -33,4 +36,30 @@ def display_feedback(is_correct, correct_answer):
     if is_correct:
         print("✅ Correct!")
     else:
-        print(f"❌ Incorrect! The correct answer is: {correct_answer}")
\ No newline at end of file
+        print(f"❌ Incorrect! The correct answer is: {correct_answer}")
+
+def display_form_diagnosis(form_index, answer, lemma, expected):
+    """Point out which form of the lemma a wrong answer actually is"""
+    # The index folds ё to е, so an answer missing only its ё looks like the
+    # asked form itself
+    if normalize_form(answer) == normalize_form(expected):
+        print(f"💡 Mind the ё: {expected}")
+        return
+
+    asked = form_index.diagnose(expected, lemma)
+    analyses = [analysis for analysis in form_index.diagnose(answer, lemma) if analysis not in asked]
+    if analyses:
+        labels = ' / '.join(analysis.describe() for analysis in analyses)
+        print(f"💡 '{answer}' is the {labels} form of {lemma}")
+        return
+
+    # Not a form of the lemma: probably a typo of one
+    close = [form for form in form_index.suggest(answer) if lemma in form_index.lemmas(form)]
+    if close:
+        print(f"💡 Did you mean: {', '.join(close)}?")
+
+def format_timestamp(epoch, fmt: str = '%Y-%m-%d') -> str:
+    """Render a stored epoch timestamp for display"""
+    if epoch is None:
+        return '-'
+    return datetime.fromtimestamp(epoch).strftime(fmt)
\ No newline at end of file